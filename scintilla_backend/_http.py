@@ -0,0 +1,24 @@
+"""
+Shared HTTP plumbing for the API test scripts.
+
+One tuned requests.Session serves every script that imports it: urllib3
+keeps TCP connections to the backend alive across calls (and across test
+files when they run in the same process), so only the first request pays
+the connect handshake. Retries are deliberately disabled — against a
+localhost backend a transient error is a test failure, and silent
+retries would mask it.
+"""
+import atexit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "http://localhost:8000"
+
+SESSION = requests.Session()
+SESSION.mount("http://localhost", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=0,
+))
+atexit.register(SESSION.close)
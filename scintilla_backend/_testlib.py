@@ -0,0 +1,130 @@
+"""
+Shared helpers for the API test scripts.
+
+The three scripts exercise the same backend and used to copy-paste the
+same plumbing: endpoint URLs, orjson encode/decode, the startup probe,
+the ETag response cache, and the add-idea POST. One copy lives here. The
+session itself comes from _http, so every script in the process shares
+one connection pool.
+"""
+import asyncio
+import os
+import time
+
+import orjson
+import requests
+
+from _http import BASE_URL, SESSION
+
+# Full endpoint URLs precomputed once at import, instead of re-running
+# an f-string join on every call.
+URL_SCRATCH_ADD = f"{BASE_URL}/scratchpad/add"
+URL_SCRATCH_ADD_BULK = f"{BASE_URL}/scratchpad/add_bulk"
+URL_SCRATCH_ALL = f"{BASE_URL}/scratchpad/all"
+URL_SCRATCH_SEARCH = f"{BASE_URL}/scratchpad/search"
+URL_SCRATCH_DEL = f"{BASE_URL}/scratchpad/delete/"
+URL_PROC_STATUS = f"{BASE_URL}/processor/status"
+URL_REVIEWER_ALL = f"{BASE_URL}/reviewer/all"
+URL_REVIEWER_LATEST = f"{BASE_URL}/reviewer/latest"
+URL_REVIEWER_EVENTS = f"{BASE_URL}/reviewer/events"
+URL_REVIEWER_APPROVE = f"{BASE_URL}/reviewer/approve/"
+URL_REVIEWER_REJECT = f"{BASE_URL}/reviewer/reject/"
+
+# Pretty-printing whole response bodies re-serializes every row; only do
+# it when explicitly asked for.
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
+
+# orjson's Rust parser replaces requests' stdlib .json() on response
+# bodies, and serializes POST payloads so requests never touches the
+# stdlib encoder either.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def json_body(response):
+    """Parses a response body with orjson instead of stdlib json."""
+    return orjson.loads(response.content)
+
+
+def print_response(body):
+    """Pretty-prints a parsed response body when TEST_VERBOSE=1."""
+    if VERBOSE:
+        print("Response:", orjson.dumps(body, option=orjson.OPT_INDENT_2).decode())
+
+
+def wait_ready(base_url: str = BASE_URL, timeout: float = 10.0) -> bool:
+    """
+    Polls the backend's /healthz endpoint with exponential backoff and
+    returns as soon as it answers, instead of sleeping a fixed two seconds
+    whether or not the server is already up.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            if SESSION.get(f"{base_url}/healthz", timeout=0.5).ok:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 1.6)
+    return False
+
+
+# Parsed list responses keyed by URL together with the server's ETag. The
+# backend answers If-None-Match with a bodiless 304 while a list is
+# unchanged, so repeat reads skip the download and the JSON parse.
+_CACHE = {}
+
+
+def cached_get(url: str):
+    """Conditional GET that returns the cached parsed body on a 304."""
+    headers = {"If-None-Match": _CACHE[url][0]} if url in _CACHE else {}
+    response = SESSION.get(url, headers=headers)
+    if response.status_code == 304:
+        return _CACHE[url][1]
+    response.raise_for_status()
+    parsed = json_body(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        _CACHE[url] = (etag, parsed)
+    return parsed
+
+
+# The add-idea POST is prepared once: URL parsing, header and cookie
+# merging, and hook setup all happen here instead of on every call. Each
+# add then only swaps the body on the prepared request.
+_ADD_IDEA_REQUEST = SESSION.prepare_request(
+    requests.Request("POST", URL_SCRATCH_ADD, headers=JSON_HEADERS)
+)
+
+
+def add_idea(idea_text: str, context_urls: str) -> str:
+    """Adds one idea to the scratchpad and returns its new ID."""
+    req = _ADD_IDEA_REQUEST
+    req.body = orjson.dumps({"idea_text": idea_text, "context_urls": context_urls})
+    req.headers["Content-Length"] = str(len(req.body))
+    response = SESSION.send(req, timeout=5)
+    response.raise_for_status()
+    return json_body(response)['id']
+
+
+async def bounded_gather(*coros, limit: int = None):
+    """
+    asyncio.gather with a concurrency cap, so wide request fan-outs keep
+    the backend busy without flooding it into timeouts and retries. The
+    cap defaults to the TEST_CONCURRENCY env var (8 when unset).
+    """
+    if limit is None:
+        limit = int(os.getenv("TEST_CONCURRENCY", "8"))
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(bounded(coro) for coro in coros))
+
+
+def get_all_ideas() -> list:
+    """Retrieves all scratchpad ideas, served from the ETag cache when fresh."""
+    return cached_get(URL_SCRATCH_ALL)
@@ -3,8 +3,15 @@ from db.db_manager import DatabaseManager
 from agents.scratchpad_agent import ScratchpadAgent
 from config.settings import settings
 from datetime import datetime
-import json
-import requests
+import httpx
+import logging
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Pooled HTTP client for Notion. Keep-alive plus HTTP/2 reuse a single TLS
+# connection across approvals instead of paying a fresh handshake per post.
+_NOTION_CLIENT = httpx.Client(http2=True, timeout=10.0)
 
 class ReviewerAgent:
     """
@@ -13,6 +20,7 @@ class ReviewerAgent:
     def __init__(self):
         self.content_db_manager = DatabaseManager(settings.content_db_path, schema_name="content")
         self.scratchpad_agent = ScratchpadAgent()
+        self.cache_db_manager = DatabaseManager(settings.response_cache_db_path, schema_name="response_cache")
         self.notion_api_url = "https://api.notion.com/v1/pages"
 
     def _post_to_notion(self, content_data: Dict) -> bool:
@@ -20,8 +28,7 @@ class ReviewerAgent:
         Posts the content to Notion using the API.
         """
         if not settings.notion_api_key or not settings.notion_database_id:
-            if settings.is_debug_mode:
-                print(f"[{datetime.now().isoformat()}] Notion API key or database ID not set. Skipping post.")
+            logger.debug("Notion API key or database ID not set. Skipping post.")
             return False
 
         headers = {
@@ -42,19 +49,16 @@ class ReviewerAgent:
         def format_next_items(items: List[Any], item_type: str) -> str:
             if not items:
                 return "No items provided."
-            formatted_text = ""
-            for item in items:
-                if item_type == "actions":
-                    formatted_text += f"- **{item.get('name', 'N/A')}** (Priority: {item.get('priority', 'N/A').capitalize()})\n"
-                else: # item_type == "reading"
-                    formatted_text += f"- {item}\n"
-            return formatted_text.strip()
+            # Single join instead of += accumulation: linear in total length
+            # rather than quadratic for long action/reading lists.
+            if item_type == "actions":
+                return "\n".join(f"- **{item.get('name', 'N/A')}** (Priority: {item.get('priority', 'N/A').capitalize()})" for item in items)
+            return "\n".join(f"- {item}" for item in items) # item_type == "reading"
         
         # Truncate content to Notion's 2000 character limit
         content = content_data.get('content', '')
         if len(content) > 2000:
-            if settings.is_debug_mode:
-                print(f"[{datetime.now().isoformat()}] Truncating content from {len(content)} to 2000 characters for Notion.")
+            logger.debug("Truncating content from %d to 2000 characters for Notion.", len(content))
             content = content[:1997] + '...' # Add an ellipsis for truncation
         
         properties = {
@@ -83,52 +87,78 @@ class ReviewerAgent:
             "properties": properties
         }
         
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Sending payload to Notion API: {json.dumps(payload, indent=2)}")
+        payload_bytes = orjson.dumps(payload)
+        logger.debug("Sending payload to Notion API: %s", payload)
 
         try:
-            response = requests.post(self.notion_api_url, headers=headers, json=payload)
+            response = _NOTION_CLIENT.post(self.notion_api_url, headers=headers, content=payload_bytes)
             response.raise_for_status()
-            if settings.is_debug_mode:
-                print(f"[{datetime.now().isoformat()}] Successfully posted to Notion. Response: {response.status_code}")
+            logger.debug("Successfully posted to Notion. Response: %s", response.status_code)
             return True
-        except requests.exceptions.RequestException as e:
-            print(f"[{datetime.now().isoformat()}] Error posting to Notion: {e}")
-            print(f"[{datetime.now().isoformat()}] Notion response content: {response.text}")
+        except httpx.HTTPStatusError as e:
+            logger.error("Error posting to Notion: %s", e)
+            logger.error("Notion response content: %s", e.response.text)
+            return False
+        except httpx.HTTPError as e:
+            logger.error("Error posting to Notion: %s", e)
             return False
 
     def get_all_content_for_review(self) -> List[Dict]:
         """Retrieves all processed content items from the database."""
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Fetching all processed content for review.")
-        
+        logger.debug("Fetching all processed content for review.")
+
         # get_all_content now returns lists, no need to deserialize here
         return self.content_db_manager.get_all_content()
 
+    def iter_all_content_for_review(self):
+        """Yields processed content items without building the full list."""
+        logger.debug("Streaming all processed content for review.")
+        return self.content_db_manager.iter_all_content()
+
+    def iter_content_summaries_for_review(self):
+        """Yields list-view summaries (no content body) of items awaiting review."""
+        logger.debug("Streaming content summaries for review.")
+        return self.content_db_manager.iter_content_summaries()
+
+    def content_freshness_token(self) -> tuple:
+        """Returns a cheap change token for the content table, for response caching."""
+        return self.content_db_manager.get_freshness_token()
+
+    def get_content_for_review(self, content_id: str) -> Optional[Dict]:
+        """Retrieves one full content item, including its body, by ID."""
+        return self.content_db_manager.get_content_by_id(content_id)
+
+    def search_content_by_tag(self, tag: str) -> List[Dict]:
+        """Retrieves content summaries carrying the given category tag."""
+        logger.debug("Searching review content for tag '%s'.", tag)
+        return self.content_db_manager.search_content_by_tag(tag)
+
+    def get_latest_content_summary(self) -> Optional[Dict]:
+        """Retrieves the summary of the newest content item, if any."""
+        return self.content_db_manager.get_latest_content_summary()
+
     def approve_and_post_to_notion(self, content_id: str) -> bool:
         """
         Approves a content item, posts to Notion, and purges it.
         """
         content_data = self.content_db_manager.get_content_by_id(content_id)
         if not content_data:
-            print(f"[{datetime.now().isoformat()}] Content with ID {content_id} not found.")
+            logger.error("Content with ID %s not found.", content_id)
             return False
-            
+
         success = self._post_to_notion(content_data)
 
         if success:
             # After successful posting to Notion, we delete the content from our local db.
             delete_success = self.content_db_manager.delete_content(content_id)
             if delete_success:
-                if settings.is_debug_mode:
-                    print(f"[{datetime.now().isoformat()}] Successfully posted and purged content with ID: {content_id}")
+                logger.debug("Successfully posted and purged content with ID: %s", content_id)
                 # Also update the status of the original idea in the scratchpad to 'approved'
                 self.scratchpad_agent.update_status(content_data['idea_id'], 'approved')
                 return True
             else:
-                 if settings.is_debug_mode:
-                    print(f"[{datetime.now().isoformat()}] Successfully posted to Notion, but failed to delete from local DB.")
-                 return False
+                logger.error("Successfully posted to Notion, but failed to delete from local DB.")
+                return False
 
         return False
 
@@ -139,22 +169,21 @@ class ReviewerAgent:
         """
         content_data = self.content_db_manager.get_content_by_id(content_id)
         if not content_data:
-            print(f"[{datetime.now().isoformat()}] Content with ID {content_id} not found.")
+            logger.error("Content with ID %s not found.", content_id)
             return False
 
         # Get original idea text and context
         original_idea = self.scratchpad_agent.get_idea(content_data['idea_id'])
         if not original_idea:
-            print(f"[{datetime.now().isoformat()}] Original idea with ID {content_data['idea_id']} not found.")
+            logger.error("Original idea with ID %s not found.", content_data['idea_id'])
             return False
 
         # Append corrections to original idea text and URLs
         new_idea_text = f"{original_idea['idea_text']}\n\n[Correction Notes]: {correction_text}"
         new_context_urls = f"{original_idea.get('context_urls', '')},{correction_urls}" if original_idea.get('context_urls') else correction_urls
         
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Re-queuing rejected idea with ID: {content_data['idea_id']}")
-            print(f"[{datetime.now().isoformat()}] New idea text: {new_idea_text}")
+        logger.debug("Re-queuing rejected idea with ID: %s", content_data['idea_id'])
+        logger.debug("New idea text: %s", new_idea_text)
 
         # Add the corrected idea back to the scratchpad queue
         new_idea_id = self.scratchpad_agent.add_new_idea(new_idea_text, new_context_urls)
@@ -164,8 +193,10 @@ class ReviewerAgent:
             self.scratchpad_agent.update_status(content_data['idea_id'], 'rejected')
             # Purge the processed content from the content database
             self.content_db_manager.delete_content(content_id)
-            if settings.is_debug_mode:
-                print(f"[{datetime.now().isoformat()}] Rejected content: {content_id}, re-queued with new ID: {new_idea_id}")
+            # Invalidate cached responses for the rejected idea so the
+            # corrected version never resolves to the old output
+            self.cache_db_manager.delete_cached_responses_for_idea(content_data['idea_id'])
+            logger.debug("Rejected content: %s, re-queued with new ID: %s", content_id, new_idea_id)
             return True
         
         return False
@@ -1,7 +1,9 @@
 from db.db_manager import DatabaseManager
 from config.settings import settings
 from typing import List, Dict, Optional
-from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ScratchpadAgent:
     """
@@ -13,34 +15,67 @@ class ScratchpadAgent:
 
     def add_new_idea(self, idea_text: str, context_urls: str) -> str:
         """Adds a new idea to the database."""
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Adding new idea to scratchpad.")
+        logger.debug("Adding new idea to scratchpad.")
         return self.db_manager.add_idea(idea_text, context_urls)
 
+    def add_new_ideas(self, rows: List[tuple]) -> List[str]:
+        """Adds many (idea_text, context_urls) pairs in one transaction."""
+        logger.debug("Adding %d new ideas to scratchpad.", len(rows))
+        return self.db_manager.add_ideas_bulk(rows)
+
     def get_all_ideas(self) -> List[Dict]:
         """Retrieves all ideas in the queue."""
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Fetching all ideas from scratchpad.")
+        logger.debug("Fetching all ideas from scratchpad.")
         return self.db_manager.get_all_ideas()
 
+    def iter_all_ideas(self):
+        """Yields all ideas in the queue without building the full list."""
+        logger.debug("Streaming all ideas from scratchpad.")
+        return self.db_manager.iter_all_ideas()
+
+    def iter_all_ideas_raw(self):
+        """Yields raw idea rows for paths that serialize sqlite3.Row directly."""
+        return self.db_manager.iter_all_ideas_raw()
+
+    def freshness_token(self) -> tuple:
+        """Returns a cheap change token for the ideas table, for response caching."""
+        return self.db_manager.get_freshness_token()
+
+    def search_ideas(self, text: str) -> List[Dict]:
+        """Retrieves ideas whose text contains the given substring."""
+        logger.debug("Searching scratchpad ideas for '%s'.", text)
+        return self.db_manager.search_ideas_by_text(text)
+
     def get_pending_ideas(self) -> List[Dict]:
         """Retrieves ideas in the queue that have not been processed."""
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Fetching pending ideas from scratchpad.")
+        logger.debug("Fetching pending ideas from scratchpad.")
         return self.db_manager.get_pending_ideas()
-        
+
+    def get_ideas_by_status(self, status: str) -> List[Dict]:
+        """Retrieves ideas with the given status, oldest first."""
+        logger.debug("Fetching ideas with status '%s' from scratchpad.", status)
+        return self.db_manager.get_ideas_by_status(status)
+
+    def get_processable_batch(self, limit: int) -> List[Dict]:
+        """Retrieves the next batch of queued/reprocess ideas, reprocess first."""
+        logger.debug("Fetching a processable batch of up to %d ideas.", limit)
+        return self.db_manager.get_processable_batch(limit)
+
     def delete_idea_by_id(self, idea_id: str) -> bool:
         """Deletes an idea from the database."""
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Deleting idea with ID: {idea_id}")
+        logger.debug("Deleting idea with ID: %s", idea_id)
         return self.db_manager.delete_idea(idea_id)
 
     def update_status(self, idea_id: str, status: str) -> bool:
         """Updates the status of an idea."""
-        if settings.is_debug_mode:
-            print(f"[{datetime.now().isoformat()}] Updating status of idea {idea_id} to '{status}'")
+        logger.debug("Updating status of idea %s to '%s'", idea_id, status)
         return self.db_manager.update_idea_status(idea_id, status)
 
+    def update_statuses(self, idea_ids: List[str], status: str) -> int:
+        """Updates many ideas to the same status in one statement."""
+        logger.debug("Updating status of %d ideas to '%s'", len(idea_ids), status)
+        return self.db_manager.update_statuses(idea_ids, status)
+
     def get_idea(self, idea_id: str) -> Optional[Dict]:
         """Retrieves a single idea by its ID."""
         return self.db_manager.get_idea(idea_id)
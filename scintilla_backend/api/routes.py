@@ -1,9 +1,15 @@
-from fastapi import APIRouter, HTTPException
-from db.schemas import IdeaCreate, Idea, RejectionPayload, Content, ProcessorLog
+import asyncio
+import hashlib
+import sqlite3
+import uuid
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from db.schemas import IdeaCreate, IdeaBulkCreate, Idea, RejectionPayload
 from agents.scratchpad_agent import ScratchpadAgent
 from agents.processor_agent import ProcessorAgent
 from agents.reviewer_agent import ReviewerAgent
-from typing import List
 from datetime import datetime
 
 # Create an API router for all our endpoints
@@ -13,37 +19,124 @@ scratchpad_agent = ScratchpadAgent()
 processor_agent = ProcessorAgent()
 reviewer_agent = ReviewerAgent()
 
+def _orjson_default(obj):
+    """
+    Lets orjson encode sqlite3 values directly: a Row becomes a dict only
+    at dump time and a 16-byte BLOB id renders as its UUID string, so the
+    *_raw iterators can hand rows to the encoder without a per-row
+    deserialization pass in Python.
+    """
+    if isinstance(obj, sqlite3.Row):
+        return dict(obj)
+    if isinstance(obj, bytes):
+        return str(uuid.UUID(bytes=obj))
+    raise TypeError
+
+
+def _stream_json_array(rows):
+    """
+    Serializes an iterable of rows (dicts or raw sqlite3.Row objects) as one
+    JSON array, yielding per row so peak memory stays constant regardless of
+    table size. Starlette iterates sync generators in a worker thread,
+    keeping the event loop free.
+    """
+    yield b"["
+    first = True
+    for row in rows:
+        if first:
+            first = False
+        else:
+            yield b","
+        yield orjson.dumps(row, default=_orjson_default)
+    yield b"]"
+
+
+# Latest serialized body per list endpoint, keyed on the table's freshness
+# token. Polling frontends re-request these lists far more often than the
+# tables change, so repeat reads cost one indexed aggregate query instead
+# of a full scan plus re-serialization.
+_LIST_CACHE = {}
+
+
+def _cached_list_response(name, token_factory, rows_factory, request: Request) -> Response:
+    """
+    Serves a list endpoint from the in-process cache while its freshness
+    token is unchanged, and honours If-None-Match with a bodiless 304 so
+    clients that already hold the current ETag skip the transfer too.
+    """
+    token = token_factory()
+    cached = _LIST_CACHE.get(name)
+    if cached is None or cached[0] != token:
+        body = b"".join(_stream_json_array(rows_factory()))
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        cached = (token, etag, body)
+        _LIST_CACHE[name] = cached
+    _, etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@api_router.get("/healthz")
+async def healthz():
+    """Liveness probe: lets scripts wait for startup instead of sleeping."""
+    return {"status": "ok"}
+
 
 @api_router.post("/scratchpad/add", response_model=Idea)
 async def add_idea(idea: IdeaCreate):
     """
     Adds a new idea to the scratchpad queue.
     """
-    idea_id = scratchpad_agent.add_new_idea(idea.idea_text, idea.context_urls)
+    idea_id = await asyncio.to_thread(scratchpad_agent.add_new_idea, idea.idea_text, idea.context_urls)
     if not idea_id:
         raise HTTPException(status_code=500, detail="Failed to add idea to scratchpad.")
     
     # Retrieve and return the full idea object to confirm success
-    idea_data = scratchpad_agent.get_idea(idea_id)
+    idea_data = await asyncio.to_thread(scratchpad_agent.get_idea, idea_id)
     if not idea_data:
         raise HTTPException(status_code=500, detail="Failed to retrieve newly added idea.")
         
     return Idea(**idea_data)
 
-@api_router.get("/scratchpad/all", response_model=List[Idea])
-async def get_all_ideas():
+@api_router.post("/scratchpad/add_bulk")
+async def add_ideas_bulk(payload: IdeaBulkCreate):
+    """
+    Adds many ideas in one request and one database transaction.
+    Returns the new idea IDs in input order.
+    """
+    rows = [(idea.idea_text, idea.context_urls) for idea in payload.ideas]
+    ids = await asyncio.to_thread(scratchpad_agent.add_new_ideas, rows)
+    if len(ids) != len(rows):
+        raise HTTPException(status_code=500, detail="Failed to add ideas to scratchpad.")
+    return {"ids": ids}
+
+@api_router.get("/scratchpad/all")
+async def get_all_ideas(request: Request):
     """
-    Retrieves all ideas from the scratchpad queue.
+    Retrieves all ideas from the scratchpad queue as a JSON array, served
+    from the in-process cache (with ETag/304 support) while the table is
+    unchanged.
     """
-    ideas_data = scratchpad_agent.get_all_ideas()
-    return [Idea(**idea) for idea in ideas_data]
+    return await asyncio.to_thread(
+        _cached_list_response, "ideas", scratchpad_agent.freshness_token, scratchpad_agent.iter_all_ideas_raw, request
+    )
+
+@api_router.get("/scratchpad/search")
+async def search_ideas(contains: str):
+    """
+    Retrieves ideas whose text contains the given substring. The filter
+    runs inside SQLite (instr), not in Python.
+    """
+    return await asyncio.to_thread(scratchpad_agent.search_ideas, contains)
 
 @api_router.delete("/scratchpad/delete/{idea_id}")
 async def delete_idea(idea_id: str):
     """
     Deletes an idea from the scratchpad by its unique ID.
     """
-    if scratchpad_agent.delete_idea_by_id(idea_id):
+    if await asyncio.to_thread(scratchpad_agent.delete_idea_by_id, idea_id):
         return {"message": f"Idea with ID '{idea_id}' deleted successfully."}
     raise HTTPException(status_code=404, detail=f"Idea with ID '{idea_id}' not found.")
 
@@ -52,32 +145,89 @@ async def get_processor_status():
     """
     Retrieves the current status of the Idea Processor dashboard.
     """
-    return processor_agent.get_processor_status()
+    return await asyncio.to_thread(processor_agent.get_processor_status)
 
 
-@api_router.get("/processor/logs", response_model=List[ProcessorLog])
+@api_router.get("/processor/logs")
 async def get_processor_logs():
     """
-    Retrieves the latest processor log entries.
+    Retrieves the latest processor log entries, streamed as a JSON array.
     """
-    logs = processor_agent.log_manager.get_all_logs()
-    return [ProcessorLog(**log) for log in logs]
+    return StreamingResponse(_stream_json_array(processor_agent.log_manager.iter_all_logs_raw()), media_type="application/json")
+
 
+@api_router.get("/reviewer/all")
+async def get_all_content_for_review(request: Request):
+    """
+    Retrieves summaries of content awaiting review as a JSON array, served
+    from the in-process cache (with ETag/304 support) while the table is
+    unchanged. The content body is fetched per item via
+    /reviewer/content/{content_id}.
+    """
+    return await asyncio.to_thread(
+        _cached_list_response, "content", reviewer_agent.content_freshness_token,
+        reviewer_agent.iter_content_summaries_for_review, request,
+    )
+
+@api_router.get("/reviewer/latest")
+async def get_latest_content_id():
+    """
+    Returns the newest review item's ID without transferring the whole
+    list: {"id": null} while the queue is empty.
+    """
+    latest = await asyncio.to_thread(reviewer_agent.get_latest_content_summary)
+    return {"id": latest["id"] if latest else None}
+
+@api_router.get("/reviewer/events")
+async def reviewer_events():
+    """
+    Server-sent events stream announcing new review content. The freshness
+    token is polled server-side (one indexed aggregate per second) and an
+    event carrying the newest item's summary is emitted the moment the
+    content table changes, so clients wait on the stream instead of
+    re-downloading the list on a timer. A comment line keeps idle
+    connections alive.
+    """
+    async def event_stream():
+        last_token = await asyncio.to_thread(reviewer_agent.content_freshness_token)
+        while True:
+            await asyncio.sleep(1.0)
+            token = await asyncio.to_thread(reviewer_agent.content_freshness_token)
+            if token != last_token:
+                last_token = token
+                latest = await asyncio.to_thread(reviewer_agent.get_latest_content_summary)
+                if latest:
+                    yield b"data: " + orjson.dumps(latest) + b"\n\n"
+            else:
+                yield b": keep-alive\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@api_router.get("/reviewer/search")
+async def search_content_by_tag(tag: str):
+    """
+    Retrieves summaries of review content whose category tags include `tag`.
+    The filter runs inside SQLite (json_each), not in Python.
+    """
+    return await asyncio.to_thread(reviewer_agent.search_content_by_tag, tag)
 
-@api_router.get("/reviewer/all", response_model=List[Content])
-async def get_all_content_for_review():
+@api_router.get("/reviewer/content/{content_id}")
+async def get_content_for_review(content_id: str):
     """
-    Retrieves all processed content awaiting review.
+    Retrieves one full content item, including its body, by its unique ID.
     """
-    content_data = reviewer_agent.get_all_content_for_review()
-    return [Content(**item) for item in content_data]
+    content = await asyncio.to_thread(reviewer_agent.get_content_for_review, content_id)
+    if not content:
+        raise HTTPException(status_code=404, detail=f"Content with ID '{content_id}' not found.")
+    return content
 
 @api_router.post("/reviewer/approve/{content_id}")
 async def approve_content(content_id: str):
     """
     Approves a content item, posts to Notion, and purges it from the content DB.
     """
-    if reviewer_agent.approve_and_post_to_notion(content_id):
+    if await asyncio.to_thread(reviewer_agent.approve_and_post_to_notion, content_id):
         return {"message": f"Content '{content_id}' approved and purged successfully."}
     raise HTTPException(status_code=404, detail=f"Content with ID '{content_id}' not found.")
 
@@ -86,6 +236,6 @@ async def reject_content(content_id: str, payload: RejectionPayload):
     """
     Rejects a content item, re-queues it with corrections, and purges it from the content DB.
     """
-    if reviewer_agent.reject_and_requeue(content_id, payload.correction_text, payload.correction_urls):
+    if await asyncio.to_thread(reviewer_agent.reject_and_requeue, content_id, payload.correction_text, payload.correction_urls):
         return {"message": f"Content '{content_id}' rejected and re-queued with corrections."}
     raise HTTPException(status_code=404, detail=f"Content with ID '{content_id}' not found.")
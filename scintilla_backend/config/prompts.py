@@ -0,0 +1,31 @@
+# Built-in prompt templates. config/prompts.json is seeded from this constant
+# on first startup and remains the user-editable override; these defaults are
+# what the processor falls back to when that file is missing.
+#
+# Each prompt is split into a static 'prefix' (instructions + JSON schema,
+# byte-identical across all ideas of the same type) and a 'suffix_template'
+# holding the per-idea variables. Keeping the variable part strictly at the
+# end lets Ollama's KV prefix cache skip prefill for the shared prefix.
+
+PROMPTS_SUFFIX = "\n\nIdea: {idea_text}\n\nContext URLs: {context_urls}\n"
+
+PROMPTS = {
+    "research": {
+        "prefix": "You are a world-class researcher. Your task is to generate a detailed research document based on the following idea and context, formatted as a JSON object. The research document should be approximately 3000 words. The response must be a single JSON object with the following structure:\n{\n  \"title\": \"A concise title for the research project\",\n  \"content\": \"The full research document, including a detailed introduction, clearly-marked chapters, and a conclusion. Each chapter must end with a relevant case study.\",\n  \"category_tags\": [\"Tag1\", \"Tag2\", \"Tag3\"],\n  \"next_actions\": [{\"name\": \"A descriptive string for a research task\", \"priority\": \"high\"}, {\"name\": \"Another task for future research\", \"priority\": \"medium\"}, {\"name\": \"A final related topic to explore\", \"priority\": \"low\"}],\n  \"next_reading\": [\"A relevant academic paper\", \"A link to a detailed blog post\", \"A book recommendation\"]\n}",
+        "suffix_template": PROMPTS_SUFFIX
+    },
+    "build": {
+        "prefix": "You are a senior project manager. Your task is to create a top-level approach, infrastructure plan, and resource list for a build project, formatted as a JSON object. The plan should be approximately 1000 words.\n\nThe response must be a single JSON object with the following structure:\n{\n  \"title\": \"A concise title for the build project plan\",\n  \"content\": \"The full 1000-word build plan, outlining the approach, infrastructure, and resources.\",\n  \"category_tags\": [\"Tag1\", \"Tag2\", \"Tag3\"],\n  \"next_actions\": [{\"name\": \"A descriptive string for the priority resource\", \"priority\": \"high\"}, {\"name\": \"A concise description of the prep work\", \"priority\": \"medium\"}, {\"name\": \"Another description of the prep work\", \"priority\": \"low\"}]\n}",
+        "suffix_template": PROMPTS_SUFFIX
+    },
+    "article": {
+        "prefix": "You are a professional content creator and master storyteller. Your task is to write a captivating story-like article based on the following idea and context, formatted as a JSON object. The article should be approximately 2000 words with a clear beginning, middle, and end. The beginning should inspire curiosity and possibilities. The middle should elaborate on the topic. The end should bring the overall theme to a satisfying conclusion, linking it back to the beginning. If the topic could have any real-life case studies, include that as well in the next_reading section of the JSON.\n\nThe response must be a single JSON object, which must mandatorily include next_reading array, with the following structure:\n{\n  \"title\": \"A catchy title for the article\",\n  \"content\": \"The full 2000-word article with a clear beginning, middle, and end.\",\n  \"category_tags\": [\"Tag1\", \"Tag2\", \"Tag3\"],\n  \"next_reading\": [\"A concise suggestion for additional media or a related resource\", \"A link to supporting information or another article\", \"Ideas on relevant real-life case studies\"]\n}",
+        "suffix_template": PROMPTS_SUFFIX
+    }
+}
+
+if __name__ == "__main__":
+    # python -m config.prompts emits the JSON file, for build/install scripts.
+    import orjson
+    with open("config/prompts.json", "wb") as f:
+        f.write(orjson.dumps(PROMPTS, option=orjson.OPT_INDENT_2))
@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import os
 
@@ -11,6 +12,13 @@ class Settings(BaseSettings):
     scratchpad_db_path: str = "scintilla_scratchpad.db"
     content_db_path: str = "scintilla_content.db"
     processor_log_db_path: str = "scintilla_processor_log.db"
+    response_cache_db_path: str = "scintilla_response_cache.db"
+
+    # Response cache for duplicate / near-duplicate ideas
+    enable_response_cache: bool = True
+    response_cache_ttl_hours: int = 24
+    response_cache_similarity_threshold: float = 0.95
+    ollama_embedding_model: str = "nomic-embed-text"
 
     # Notion integration
     notion_api_key: Optional[str] = os.getenv("NOTION_API_KEY")
@@ -22,15 +30,35 @@ class Settings(BaseSettings):
     # Ollama API URL
     ollama_base_url: str = "http://localhost:11434"
 
+    # How long the Ollama runner keeps the model resident after a request.
+    # Longer than the processing interval, so scheduled runs never pay the
+    # model-load cost.
+    ollama_keep_alive: str = "30m"
+
+    # Ollama server-side parallelism. These mirror the OLLAMA_NUM_PARALLEL and
+    # OLLAMA_MAX_LOADED_MODELS environment variables, which must be set on the
+    # Ollama server itself. Batch processing overlaps requests up to
+    # min(processing_batch_size, ollama_num_parallel).
+    ollama_num_parallel: int = 4
+    ollama_max_loaded_models: int = 1
+
     # Processor scheduling (placeholders for now)
     processing_batch_size: int = 5
     processing_interval_minutes: int = 3
     processing_batch_max_rerun: int = 3
+    # Maximum ideas processed concurrently within a batch
+    processing_concurrency: int = 4
 
     # Debugging flag
     is_debug_mode: bool = True
-    
-    class Config:
-        env_file = '.env'
-        
-settings = Settings()
\ No newline at end of file
+
+    # Frozen so the instance is immutable and safe to share across the API
+    # worker threads and the scheduled processor.
+    model_config = SettingsConfigDict(env_file='.env', frozen=True)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parses the environment and .env file once per process and reuses the instance."""
+    return Settings()
+
+settings = get_settings()
\ No newline at end of file
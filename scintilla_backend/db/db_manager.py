@@ -1,312 +1,869 @@
+import logging
 import sqlite3
+import threading
+import time
+import weakref
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import uuid
-import json
-from config.settings import settings
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Serialized form of an empty list, precomputed once: absent next_actions /
+# next_reading columns always store this exact string.
+EMPTY_JSON_ARRAY = "[]"
+
+# SQLite allows only one writer at a time. Writers within this process queue
+# behind this lock instead of colliding on "database is locked". It does not
+# reach across processes: the scheduled processor (process_ideas.py) runs
+# separately from the API server, and writes between the two are arbitrated
+# by WAL journaling plus busy_timeout, not by this lock.
+GLOBAL_WRITE_LOCK = threading.Lock()
+
+# Every manager registers itself here so the application shutdown hook can
+# close all long-lived connections in one call.
+_ALL_MANAGERS = weakref.WeakSet()
+
+def close_all_connections():
+    """Closes the connections of every DatabaseManager created so far."""
+    for manager in list(_ALL_MANAGERS):
+        manager.close()
+
+def _id_to_db(value):
+    """
+    Converts a UUID string into its 16-byte BLOB form for binding. Raw bytes
+    and non-UUID strings pass through. Legacy TEXT UUID ids are rewritten to
+    BLOBs by create_tables, so the BLOB form matches every row.
+    """
+    if isinstance(value, str):
+        try:
+            return uuid.UUID(value).bytes
+        except ValueError:
+            return value
+    return value
+
+def _id_from_db(value):
+    """Converts a stored 16-byte BLOB id back into its canonical UUID string."""
+    if isinstance(value, bytes):
+        return str(uuid.UUID(bytes=value))
+    return value
+
+def _now_us() -> int:
+    """
+    Current time as integer microseconds since the epoch. Stored in place of
+    ISO-8601 text: 8-byte index entries instead of ~26, and ORDER BY becomes
+    an integer compare.
+    """
+    return int(time.time() * 1_000_000)
+
+def _ts_from_db(value):
+    """
+    Converts a stored epoch-microsecond timestamp back to ISO-8601 text at
+    the read boundary, so agents, Notion, and the frontend keep seeing the
+    format they always have. Legacy TEXT rows pass through.
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1_000_000).isoformat()
+    return value
+
 class DatabaseManager:
     """
     Manages all interactions with the SQLite database.
     Handles table creation and CRUD operations.
     Supports both scratchpad and content schemas.
     """
+    # SQL statements as class-level constants: passing the identical string
+    # object on every call guarantees a hit in sqlite3's statement cache.
+    SQL_INSERT_IDEA = "INSERT INTO ideas (id, idea_text, context_urls, status, timestamp) VALUES (?, ?, ?, ?, ?)"
+    SQL_GET_ALL_IDEAS = "SELECT * FROM ideas ORDER BY timestamp ASC"
+    SQL_GET_IDEAS_BY_STATUS = "SELECT * FROM ideas WHERE status = ? ORDER BY timestamp ASC"
+    SQL_GET_PROCESSABLE_BATCH = (
+        "SELECT * FROM ideas WHERE status IN ('reprocess', 'in queue') "
+        "ORDER BY CASE status WHEN 'reprocess' THEN 0 ELSE 1 END, timestamp ASC LIMIT ?"
+    )
+    SQL_GET_IDEA = "SELECT * FROM ideas WHERE id = ?"
+    # instr() needs no wildcard escaping, unlike LIKE with user-supplied text.
+    SQL_SEARCH_IDEAS_BY_TEXT = "SELECT * FROM ideas WHERE instr(idea_text, ?) > 0 ORDER BY timestamp ASC"
+    SQL_UPDATE_IDEA_STATUS = "UPDATE ideas SET status = ? WHERE id = ?"
+    SQL_DELETE_IDEA = "DELETE FROM ideas WHERE id = ?"
+    SQL_INSERT_CONTENT = "INSERT INTO content (id, idea_id, project_type, title, content, category_tags, next_actions, next_reading, status, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    # Whole-batch insert through a single JSON parameter: sidesteps SQLite's
+    # bound-parameter limit and the per-row Python->C calls of executemany.
+    # Ids travel as hex text and unhex() restores the BLOB form.
+    SQL_INSERT_CONTENT_JSON = (
+        "INSERT INTO content (id, idea_id, project_type, title, content, category_tags, next_actions, next_reading, status, timestamp) "
+        "SELECT unhex(json_extract(v.value, '$.id')), unhex(json_extract(v.value, '$.idea_id')), "
+        "json_extract(v.value, '$.project_type'), json_extract(v.value, '$.title'), json_extract(v.value, '$.content'), "
+        "json_extract(v.value, '$.category_tags'), json_extract(v.value, '$.next_actions'), json_extract(v.value, '$.next_reading'), "
+        "json_extract(v.value, '$.status'), json_extract(v.value, '$.timestamp') "
+        "FROM json_each(?) AS v"
+    )
+    # Above this row count the JSON path replaces executemany.
+    JSON_INSERT_THRESHOLD = 500
+    SQL_GET_ALL_CONTENT = "SELECT * FROM content ORDER BY timestamp ASC"
+    SQL_LIST_CONTENT_SUMMARIES = "SELECT id, idea_id, project_type, title, category_tags, status, timestamp FROM content ORDER BY timestamp ASC"
+    SQL_SEARCH_CONTENT_BY_TAG = (
+        "SELECT id, idea_id, project_type, title, category_tags, status, timestamp FROM content "
+        "WHERE EXISTS (SELECT 1 FROM json_each(content.category_tags) WHERE json_each.value = ?) "
+        "ORDER BY timestamp ASC"
+    )
+    SQL_GET_LATEST_CONTENT_SUMMARY = (
+        "SELECT id, idea_id, project_type, title, category_tags, status, timestamp FROM content "
+        "ORDER BY timestamp DESC LIMIT 1"
+    )
+    SQL_GET_CONTENT_BY_ID = "SELECT * FROM content WHERE id = ?"
+    SQL_DELETE_CONTENT = "DELETE FROM content WHERE id = ?"
+    SQL_INSERT_LOG = "INSERT INTO processor_log (id, idea_id, message, timestamp) VALUES (?, ?, ?, ?)"
+    SQL_GET_ALL_LOGS = "SELECT * FROM processor_log ORDER BY timestamp DESC"
+    SQL_IDEAS_FRESHNESS = "SELECT status, COUNT(*), MAX(timestamp) FROM ideas GROUP BY status ORDER BY status"
+    SQL_CONTENT_FRESHNESS = "SELECT status, COUNT(*), MAX(timestamp) FROM content GROUP BY status ORDER BY status"
+    SQL_GET_CACHED_RESPONSE = "SELECT response_json FROM response_cache WHERE cache_key = ? AND timestamp >= ?"
+    # Same-type filter: a similar idea of another project type was generated
+    # under a different prompt, so its response must never be served here.
+    SQL_GET_CACHED_EMBEDDINGS = "SELECT cache_key, response_json, embedding FROM response_cache WHERE project_type = ? AND embedding IS NOT NULL AND timestamp >= ?"
+    SQL_PRUNE_CACHE = "DELETE FROM response_cache WHERE timestamp < ?"
+    SQL_UPSERT_CACHED_RESPONSE = "INSERT OR REPLACE INTO response_cache (cache_key, idea_id, project_type, response_json, embedding, timestamp) VALUES (?, ?, ?, ?, ?, ?)"
+    SQL_DELETE_CACHE_FOR_IDEA = "DELETE FROM response_cache WHERE idea_id = ?"
+
+    # Secondary indexes per table. create_tables builds them from here, and
+    # bulk_load drops/re-creates them around very large imports so each
+    # inserted row skips the B-tree maintenance and the index is built once
+    # at the end instead.
+    SECONDARY_INDEXES = {
+        "ideas": [
+            ("idx_ideas_status_ts", "CREATE INDEX IF NOT EXISTS idx_ideas_status_ts ON ideas(status, timestamp);"),
+        ],
+        "content": [
+            ("idx_content_status", "CREATE INDEX IF NOT EXISTS idx_content_status ON content(status);"),
+            ("idx_content_tag0", "CREATE INDEX IF NOT EXISTS idx_content_tag0 ON content(json_extract(category_tags, '$[0]'));"),
+        ],
+    }
+    # Below this row count index maintenance is cheaper than a full rebuild.
+    BULK_LOAD_THRESHOLD = 1000
+
+    # Columns holding UUID ids per schema, for the legacy-id migration in
+    # create_tables.
+    ID_COLUMNS = {
+        "ideas": ["id"],
+        "content": ["id", "idea_id"],
+        "processor_log": ["id", "idea_id"],
+        "response_cache": ["idea_id"],
+    }
+
+    # Canonical table definition per schema. create_tables runs these, and
+    # _migrate_legacy_timestamps re-runs them when a legacy table has to be
+    # rebuilt around the retyped timestamp column.
+    TABLE_SCHEMAS = {
+        "ideas": (
+            """
+            CREATE TABLE IF NOT EXISTS ideas (
+                id BLOB PRIMARY KEY,
+                idea_text TEXT NOT NULL,
+                context_urls TEXT,
+                status TEXT NOT NULL,
+                timestamp INTEGER NOT NULL
+            );
+            """
+        ),
+        "content": (
+            """
+            CREATE TABLE IF NOT EXISTS content (
+                id BLOB PRIMARY KEY,
+                idea_id BLOB NOT NULL,
+                project_type TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                category_tags TEXT,
+                next_actions TEXT,
+                next_reading TEXT,
+                status TEXT NOT NULL,
+                timestamp INTEGER NOT NULL
+            );
+            """
+        ),
+        "processor_log": (
+            """
+            CREATE TABLE IF NOT EXISTS processor_log (
+                id BLOB PRIMARY KEY,
+                idea_id BLOB,
+                message TEXT NOT NULL,
+                timestamp INTEGER NOT NULL
+            );
+            """
+        ),
+        "response_cache": (
+            """
+            CREATE TABLE IF NOT EXISTS response_cache (
+                cache_key TEXT PRIMARY KEY,
+                idea_id BLOB,
+                project_type TEXT,
+                response_json TEXT NOT NULL,
+                embedding TEXT,
+                timestamp INTEGER NOT NULL
+            );
+            """
+        ),
+    }
+
+    # Converts a legacy timestamp value to epoch microseconds during the
+    # table rebuild: ISO-8601 text (always contains dashes) via strftime,
+    # digit strings and ints by plain cast.
+    TS_CONVERT_EXPR = (
+        "CASE WHEN timestamp LIKE '%-%' "
+        "THEN CAST(strftime('%s', timestamp) AS INTEGER) * 1000000 "
+        "ELSE CAST(timestamp AS INTEGER) END"
+    )
+
     def __init__(self, db_path: str, schema_name: str = "ideas"):
         self.db_path = db_path
         self.schema_name = schema_name
-        self.conn = None
-        self.cursor = None
+        # One long-lived connection per manager, opened lazily. Python's
+        # sqlite3 module serializes access to a shared connection, and all
+        # writes additionally queue behind GLOBAL_WRITE_LOCK.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        _ALL_MANAGERS.add(self)
 
-    def _connect(self):
-        """Establishes a connection to the database."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        self.cursor = self.conn.cursor()
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the long-lived connection, opening it on first use."""
+        if self._conn is None:
+            with self._conn_lock:
+                if self._conn is None:
+                    # cached_statements keeps prepared statements for every
+                    # distinct SQL string below, so repeat calls skip the
+                    # parse/plan step entirely.
+                    conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+                    conn.row_factory = sqlite3.Row
+                    # WAL lets readers proceed while a write is in flight, and NORMAL
+                    # synchronous drops the second fsync per commit (safe under WAL).
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.execute("PRAGMA busy_timeout=5000")
+                    conn.execute("PRAGMA temp_store=MEMORY")
+                    conn.execute("PRAGMA cache_size=-64000")
+                    conn.execute("PRAGMA mmap_size=268435456")
+                    self._conn = conn
+        return self._conn
 
-    def _disconnect(self):
-        """Closes the database connection."""
-        if self.conn:
-            self.conn.close()
+    def close(self):
+        """Closes the long-lived connection; called on application shutdown."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def create_tables(self):
         """
         Creates the necessary tables if they do not exist, based on schema_name.
         """
-        self._connect()
+        conn = self._connect()
         try:
+            cursor = conn.cursor()
+            cursor.execute(self.TABLE_SCHEMAS[self.schema_name])
+            self._migrate_legacy_timestamps(cursor)
+            self._migrate_legacy_ids(cursor)
             if self.schema_name == "ideas":
-                self.cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS ideas (
-                        id TEXT PRIMARY KEY,
-                        idea_text TEXT NOT NULL,
-                        context_urls TEXT,
-                        status TEXT NOT NULL,
-                        timestamp TEXT NOT NULL
-                    );
-                    """
-                )
-            elif self.schema_name == "content":
-                self.cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS content (
-                        id TEXT PRIMARY KEY,
-                        idea_id TEXT NOT NULL,
-                        project_type TEXT NOT NULL,
-                        title TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        category_tags TEXT,
-                        next_actions TEXT,
-                        next_reading TEXT,
-                        status TEXT NOT NULL,
-                        timestamp TEXT NOT NULL
-                    );
-                    """
-                )
+                # Every poll filters on status and orders by timestamp, so the
+                # composite index serves the queue queries as a pre-sorted
+                # range scan (it supersedes the earlier status-only index).
+                cursor.execute("DROP INDEX IF EXISTS idx_ideas_status;")
             elif self.schema_name == "processor_log":
-                self.cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS processor_log (
-                        id TEXT PRIMARY KEY,
-                        idea_id TEXT,
-                        message TEXT NOT NULL,
-                        timestamp TEXT NOT NULL
-                    );
-                    """
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_processor_log_timestamp ON processor_log(timestamp);")
+            elif self.schema_name == "response_cache":
+                # Older caches predate the project_type column. Their entries
+                # keep a NULL type, which the same-type similarity filter
+                # never matches, so they simply age out via the TTL.
+                cursor.execute("SELECT COUNT(*) FROM pragma_table_info('response_cache') WHERE name = 'project_type'")
+                if cursor.fetchone()[0] == 0:
+                    cursor.execute("ALTER TABLE response_cache ADD COLUMN project_type TEXT")
+            for _, create_sql in self.SECONDARY_INDEXES.get(self.schema_name, []):
+                cursor.execute(create_sql)
+            conn.commit()
+            logger.debug("Tables created successfully in %s", self.db_path)
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+
+    def _migrate_legacy_timestamps(self, cursor):
+        """
+        Rebuilds the table when its timestamp column predates the INTEGER
+        declaration. CREATE TABLE IF NOT EXISTS cannot retype an existing
+        column, and an in-place UPDATE is futile there: the legacy column's
+        TEXT affinity turns the computed epoch integer — and every int bound
+        on later inserts — straight back into a digit string. Renaming the
+        old table, re-running the canonical CREATE, and copying rows across
+        with the conversion is the only way to get real INTEGER storage.
+        Sub-second precision of old ISO rows is lost.
+        """
+        table = self.schema_name
+        cursor.execute(f"SELECT type FROM pragma_table_info('{table}') WHERE name = 'timestamp'")
+        row = cursor.fetchone()
+        if row is None or row[0] == "INTEGER":
+            return
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        cursor.execute(self.TABLE_SCHEMAS[table])
+        cursor.execute(f"SELECT name FROM pragma_table_info('{table}')")
+        columns = [r[0] for r in cursor.fetchall()]
+        select_exprs = ", ".join(
+            self.TS_CONVERT_EXPR if column == "timestamp" else column for column in columns
+        )
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) SELECT {select_exprs} FROM {table}_legacy"
+        )
+        cursor.execute(f"DROP TABLE {table}_legacy")
+        logger.debug("Rebuilt %s with an INTEGER timestamp column.", table)
+
+    def _migrate_legacy_ids(self, cursor):
+        """
+        One-time migration of legacy 36-char TEXT UUID ids to their 16-byte
+        BLOB form. A BLOB parameter never compares equal to a TEXT value in
+        SQLite, so without this every id-parameterized statement silently
+        misses rows written before ids became BLOBs. The typeof() guard
+        makes reruns a no-op.
+        """
+        for column in self.ID_COLUMNS.get(self.schema_name, []):
+            cursor.execute(
+                f"SELECT rowid, {column} FROM {self.schema_name} "
+                f"WHERE typeof({column}) = 'text' AND length({column}) = 36"
+            )
+            converted = []
+            for rowid, legacy_id in cursor.fetchall():
+                try:
+                    converted.append((uuid.UUID(legacy_id).bytes, rowid))
+                except ValueError:
+                    continue
+            if converted:
+                cursor.executemany(
+                    f"UPDATE {self.schema_name} SET {column} = ? WHERE rowid = ?", converted
                 )
-            self.conn.commit()
-            if settings.is_debug_mode:
-                print(f"[{datetime.now().isoformat()}] Tables created successfully in {self.db_path}")
+                logger.debug(
+                    "Migrated %d legacy TEXT ids in %s.%s",
+                    len(converted), self.schema_name, column,
+                )
+
+    def add_ideas_bulk(self, rows: List[tuple]) -> List[str]:
+        """
+        Inserts many (idea_text, context_urls) pairs in one executemany
+        transaction, so a batch pays a single commit/fsync instead of one
+        per row. Returns the new idea IDs in input order.
+        """
+        if not rows:
+            return []
+        conn = self._connect()
+        timestamp = _now_us()
+        prepared = [
+            (uuid.uuid4().bytes, idea_text, context_urls, "in queue", timestamp)
+            for idea_text, context_urls in rows
+        ]
+        try:
+            with GLOBAL_WRITE_LOCK:
+                conn.executemany(self.SQL_INSERT_IDEA, prepared)
+                conn.commit()
+            return [_id_from_db(row[0]) for row in prepared]
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
-        finally:
-            self._disconnect()
+            logger.error("An error occurred: %s", e)
+            return []
 
     def add_idea(self, idea_text: str, context_urls: str) -> str:
         """Adds a new idea to the scratchpad queue."""
-        self._connect()
-        idea_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-        status = "in queue"
-        
-        try:
-            self.cursor.execute(
-                "INSERT INTO ideas (id, idea_text, context_urls, status, timestamp) VALUES (?, ?, ?, ?, ?)",
-                (idea_id, idea_text, context_urls, status, timestamp),
-            )
-            self.conn.commit()
-            return idea_id
-        except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
-            return None
-        finally:
-            self._disconnect()
+        ids = self.add_ideas_bulk([(idea_text, context_urls)])
+        return ids[0] if ids else None
 
-    def add_content(self, idea_id: str, project_type: str, title: str, content: str, category_tags: List[str], next_actions: Optional[List[Dict]] = [], next_reading: Optional[List[str]] = []) -> str:
-        """Adds new processed content to the content database."""
-        self._connect()
-        content_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
+    def add_contents_bulk(self, rows: List[tuple]) -> List[str]:
+        """
+        Inserts many (idea_id, project_type, title, content, category_tags,
+        next_actions, next_reading) tuples in one transaction. Returns the
+        new content IDs in input order.
+        """
+        if not rows:
+            return []
+        conn = self._connect()
+        timestamp = _now_us()
         status = "awaiting review"
-        
         try:
             # We must serialize the lists to JSON strings before saving to SQLite
-            category_tags_str = json.dumps(category_tags)
-            next_actions_str = json.dumps(next_actions) if next_actions else json.dumps([])
-            next_reading_str = json.dumps(next_reading) if next_reading else json.dumps([])
-            
-            self.cursor.execute(
-                "INSERT INTO content (id, idea_id, project_type, title, content, category_tags, next_actions, next_reading, status, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (content_id, idea_id, project_type, title, content, category_tags_str, next_actions_str, next_reading_str, status, timestamp),
+            prepared = [
+                (
+                    uuid.uuid4().bytes, _id_to_db(idea_id), project_type, title, content,
+                    orjson.dumps(category_tags).decode(),
+                    orjson.dumps(next_actions).decode() if next_actions else EMPTY_JSON_ARRAY,
+                    orjson.dumps(next_reading).decode() if next_reading else EMPTY_JSON_ARRAY,
+                    status, timestamp,
+                )
+                for idea_id, project_type, title, content, category_tags, next_actions, next_reading in rows
+            ]
+            # executemany is the default; very large batches (bulk imports)
+            # go through one json_each parameter instead, provided every
+            # idea_id is in BLOB form (legacy text ids cannot round-trip hex).
+            use_json_path = (
+                len(prepared) > self.JSON_INSERT_THRESHOLD
+                # unhex() first shipped in SQLite 3.41.
+                and sqlite3.sqlite_version_info >= (3, 41, 0)
+                and all(isinstance(row[1], bytes) for row in prepared)
             )
-            self.conn.commit()
-            return content_id
+            with GLOBAL_WRITE_LOCK:
+                if use_json_path:
+                    payload = orjson.dumps([
+                        {
+                            "id": row[0].hex(),
+                            "idea_id": row[1].hex(),
+                            "project_type": row[2],
+                            "title": row[3],
+                            "content": row[4],
+                            "category_tags": row[5],
+                            "next_actions": row[6],
+                            "next_reading": row[7],
+                            "status": row[8],
+                            "timestamp": row[9],
+                        }
+                        for row in prepared
+                    ]).decode()
+                    conn.execute(self.SQL_INSERT_CONTENT_JSON, (payload,))
+                else:
+                    conn.executemany(self.SQL_INSERT_CONTENT, prepared)
+                conn.commit()
+            return [_id_from_db(row[0]) for row in prepared]
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
-            return None
+            logger.error("An error occurred: %s", e)
+            return []
+
+    def bulk_load(self, rows: List[tuple], table: str = "ideas") -> List[str]:
+        """
+        Inserts a large batch into `table` ("ideas" or "content") with the
+        table's secondary indexes dropped for the duration, so every row
+        skips the per-insert B-tree maintenance and the indexes are rebuilt
+        once at the end. Small batches (<= BULK_LOAD_THRESHOLD) go straight
+        to the normal bulk insert, where live index upkeep is cheaper than
+        a rebuild. Returns the new row IDs in input order.
+        """
+        inserter = self.add_ideas_bulk if table == "ideas" else self.add_contents_bulk
+        if len(rows) <= self.BULK_LOAD_THRESHOLD:
+            return inserter(rows)
+        indexes = self.SECONDARY_INDEXES.get(table, [])
+        conn = self._connect()
+        with GLOBAL_WRITE_LOCK:
+            for index_name, _ in indexes:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+            conn.commit()
+        try:
+            return inserter(rows)
         finally:
-            self._disconnect()
+            # Rebuild even if the insert failed, so readers never run
+            # against a table missing its indexes.
+            with GLOBAL_WRITE_LOCK:
+                for _, create_sql in indexes:
+                    conn.execute(create_sql)
+                conn.commit()
+
+    def add_content(self, idea_id: str, project_type: str, title: str, content: str, category_tags: List[str], next_actions: Optional[List[Dict]] = None, next_reading: Optional[List[str]] = None) -> str:
+        """Adds new processed content to the content database."""
+        ids = self.add_contents_bulk([(idea_id, project_type, title, content, category_tags, next_actions, next_reading)])
+        return ids[0] if ids else None
+
+    def get_freshness_token(self) -> tuple:
+        """
+        Returns a cheap change token for the manager's main table: per-status
+        row counts plus the newest timestamp, read off the status index.
+        Any insert, delete, or status flip changes the token, so response
+        caches keyed on it can never serve stale data.
+        """
+        sql = self.SQL_IDEAS_FRESHNESS if self.schema_name == "ideas" else self.SQL_CONTENT_FRESHNESS
+        try:
+            cursor = self._connect().execute(sql)
+            return tuple(tuple(row) for row in cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            # A unique token forces a cache miss rather than risking staleness.
+            return (datetime.now().isoformat(),)
+
+    def _deserialize_idea_row(self, row) -> Dict:
+        """Converts an idea row into a dict with the id in string form."""
+        item = dict(row)
+        item['id'] = _id_from_db(item['id'])
+        item['timestamp'] = _ts_from_db(item['timestamp'])
+        return item
 
     def get_all_ideas(self) -> List[Dict]:
         """Retrieves all ideas from the scratchpad, ordered by timestamp (FIFO)."""
-        self._connect()
         try:
-            self.cursor.execute("SELECT * FROM ideas ORDER BY timestamp ASC")
-            rows = self.cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor = self._connect().execute(self.SQL_GET_ALL_IDEAS)
+            rows = cursor.fetchall()
+            return [self._deserialize_idea_row(row) for row in rows]
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
+            return []
+
+    def iter_all_ideas(self, batch_size: int = 500):
+        """Yields ideas ordered by timestamp (FIFO) without materializing the full table."""
+        try:
+            cursor = self._connect().execute(self.SQL_GET_ALL_IDEAS)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._deserialize_idea_row(row)
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+
+    def iter_all_ideas_raw(self, batch_size: int = 500):
+        """
+        Yields raw sqlite3.Row idea rows, skipping the per-row dict build
+        and id conversion. For serialization paths whose encoder handles
+        Row and BLOB ids itself (see api.routes._orjson_default).
+        """
+        try:
+            cursor = self._connect().execute(self.SQL_GET_ALL_IDEAS)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+
+    def search_ideas_by_text(self, text: str) -> List[Dict]:
+        """
+        Retrieves ideas whose text contains the given substring. The match
+        runs inside SQLite via instr(), so no rows are parsed in Python just
+        to be filtered out.
+        """
+        try:
+            cursor = self._connect().execute(self.SQL_SEARCH_IDEAS_BY_TEXT, (text,))
+            return [self._deserialize_idea_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
             return []
-        finally:
-            self._disconnect()
 
     def get_pending_ideas(self) -> List[Dict]:
         """Retrieves ideas in the queue that have not been processed."""
-        self._connect()
+        return self.get_ideas_by_status("in queue")
+
+    def get_ideas_by_status(self, status: str) -> List[Dict]:
+        """Retrieves ideas with the given status, oldest first (index-backed)."""
         try:
-            self.cursor.execute("SELECT * FROM ideas WHERE status = 'in queue' ORDER BY timestamp ASC")
-            rows = self.cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor = self._connect().execute(self.SQL_GET_IDEAS_BY_STATUS, (status,))
+            rows = cursor.fetchall()
+            return [self._deserialize_idea_row(row) for row in rows]
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
+            return []
+
+    def get_processable_batch(self, limit: int) -> List[Dict]:
+        """
+        Retrieves the next batch of ideas to process in one query:
+        reprocess entries first, then queued ones, oldest first within each
+        group. Only `limit` rows ever cross from SQLite into Python.
+        """
+        try:
+            cursor = self._connect().execute(self.SQL_GET_PROCESSABLE_BATCH, (limit,))
+            rows = cursor.fetchall()
+            return [self._deserialize_idea_row(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
             return []
-        finally:
-            self._disconnect()
 
     def get_idea(self, idea_id: str) -> Optional[Dict]:
         """Retrieves a single idea by its ID."""
-        self._connect()
         try:
-            self.cursor.execute("SELECT * FROM ideas WHERE id = ?", (idea_id,))
-            row = self.cursor.fetchone()
-            return dict(row) if row else None
+            cursor = self._connect().execute(self.SQL_GET_IDEA, (_id_to_db(idea_id),))
+            row = cursor.fetchone()
+            return self._deserialize_idea_row(row) if row else None
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return None
-        finally:
-            self._disconnect()
 
     def update_idea_status(self, idea_id: str, status: str) -> bool:
         """Updates the status of an idea in the scratchpad."""
-        self._connect()
+        conn = self._connect()
         try:
-            self.cursor.execute("UPDATE ideas SET status = ? WHERE id = ?", (status, idea_id))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
+            with GLOBAL_WRITE_LOCK:
+                cursor = conn.execute(self.SQL_UPDATE_IDEA_STATUS, (status, _id_to_db(idea_id)))
+                conn.commit()
+            return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return False
-        finally:
-            self._disconnect()
+
+    def update_statuses(self, idea_ids: List[str], status: str) -> int:
+        """
+        Moves many ideas to the same status with one UPDATE ... WHERE id IN
+        statement and a single commit, instead of one fsync per idea. The
+        statement cache still applies per distinct batch size. Returns the
+        number of rows updated.
+        """
+        if not idea_ids:
+            return 0
+        conn = self._connect()
+        placeholders = ",".join("?" * len(idea_ids))
+        sql = f"UPDATE ideas SET status = ? WHERE id IN ({placeholders})"
+        try:
+            with GLOBAL_WRITE_LOCK:
+                cursor = conn.execute(sql, (status, *(_id_to_db(idea_id) for idea_id in idea_ids)))
+                conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return 0
 
     def delete_idea(self, idea_id: str) -> bool:
         """Deletes an idea from the scratchpad."""
-        self._connect()
+        conn = self._connect()
         try:
-            self.cursor.execute("DELETE FROM ideas WHERE id = ?", (idea_id,))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
+            with GLOBAL_WRITE_LOCK:
+                cursor = conn.execute(self.SQL_DELETE_IDEA, (_id_to_db(idea_id),))
+                conn.commit()
+            return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return False
-        finally:
-            self._disconnect()
+
+    def _deserialize_content_row(self, row) -> Dict:
+        """Converts a content row into a dict, parsing the JSON list columns."""
+        item = dict(row)
+        item['id'] = _id_from_db(item['id'])
+        item['idea_id'] = _id_from_db(item['idea_id'])
+        item['timestamp'] = _ts_from_db(item['timestamp'])
+        try:
+            item['category_tags'] = orjson.loads(item['category_tags']) if item['category_tags'] else []
+        except (orjson.JSONDecodeError, TypeError):
+            item['category_tags'] = item['category_tags'].split(',') if item['category_tags'] else []
+
+        try:
+            item['next_actions'] = orjson.loads(item['next_actions'])
+        except (orjson.JSONDecodeError, TypeError):
+            # Fallback for old data: convert simple string list to list of dicts
+            if isinstance(item['next_actions'], str):
+                item['next_actions'] = [{'name': s.strip(), 'priority': 'low'} for s in item['next_actions'].split('\n')]
+            else:
+                item['next_actions'] = []
+
+        try:
+            item['next_reading'] = orjson.loads(item['next_reading'])
+        except (orjson.JSONDecodeError, TypeError):
+            item['next_reading'] = item['next_reading'].split('\n') if item['next_reading'] else []
+
+        return item
 
     def get_all_content(self) -> List[Dict]:
         """Retrieves all processed content from the content database."""
-        self._connect()
-        try:
-            self.cursor.execute("SELECT * FROM content ORDER BY timestamp ASC")
-            rows = self.cursor.fetchall()
-            
-            # Deserialize JSON strings back to lists
-            content_list = []
-            for row in rows:
-                item = dict(row)
-                try:
-                    item['category_tags'] = json.loads(item['category_tags']) if item['category_tags'] else []
-                except (json.JSONDecodeError, TypeError):
-                    item['category_tags'] = item['category_tags'].split(',') if item['category_tags'] else []
-                
-                try:
-                    item['next_actions'] = json.loads(item['next_actions'])
-                except (json.JSONDecodeError, TypeError):
-                    # Fallback for old data: convert simple string list to list of dicts
-                    if isinstance(item['next_actions'], str):
-                        item['next_actions'] = [{'name': s.strip(), 'priority': 'low'} for s in item['next_actions'].split('\n')]
-                    else:
-                        item['next_actions'] = []
-                
-                try:
-                    item['next_reading'] = json.loads(item['next_reading'])
-                except (json.JSONDecodeError, TypeError):
-                    item['next_reading'] = item['next_reading'].split('\n') if item['next_reading'] else []
+        try:
+            cursor = self._connect().execute(self.SQL_GET_ALL_CONTENT)
+            return [self._deserialize_content_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return []
 
-                content_list.append(item)
-            return content_list
+    def iter_all_content(self, batch_size: int = 500):
+        """Yields deserialized content rows without materializing the full table."""
+        try:
+            cursor = self._connect().execute(self.SQL_GET_ALL_CONTENT)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._deserialize_content_row(row)
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
 
+    def _deserialize_summary_row(self, row) -> Dict:
+        """Converts a content summary row (no body) into a dict."""
+        item = dict(row)
+        item['id'] = _id_from_db(item['id'])
+        item['idea_id'] = _id_from_db(item['idea_id'])
+        item['timestamp'] = _ts_from_db(item['timestamp'])
+        try:
+            item['category_tags'] = orjson.loads(item['category_tags']) if item['category_tags'] else []
+        except (orjson.JSONDecodeError, TypeError):
+            item['category_tags'] = item['category_tags'].split(',') if item['category_tags'] else []
+        return item
+
+    def iter_content_summaries(self, batch_size: int = 500):
+        """
+        Yields content rows without the multi-thousand-word content body and
+        the next_actions/next_reading columns. List views only need the small
+        columns, so this skips reading (and parsing) ~99% of the bytes per row.
+        """
+        try:
+            cursor = self._connect().execute(self.SQL_LIST_CONTENT_SUMMARIES)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._deserialize_summary_row(row)
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
+
+    def search_content_by_tag(self, tag: str) -> List[Dict]:
+        """
+        Retrieves content summaries whose category_tags contain the given tag.
+        The match runs inside SQLite via json_each, so no rows are parsed in
+        Python just to be filtered out.
+        """
+        try:
+            cursor = self._connect().execute(self.SQL_SEARCH_CONTENT_BY_TAG, (tag,))
+            return [self._deserialize_summary_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
             return []
-        finally:
-            self._disconnect()
+
+    def get_latest_content_summary(self) -> Optional[Dict]:
+        """Retrieves the summary of the newest content item, if any."""
+        try:
+            cursor = self._connect().execute(self.SQL_GET_LATEST_CONTENT_SUMMARY)
+            row = cursor.fetchone()
+            return self._deserialize_summary_row(row) if row else None
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return None
 
     def get_content_by_id(self, content_id: str) -> Optional[Dict]:
         """Retrieves a single processed content item by its ID."""
-        self._connect()
         try:
-            self.cursor.execute("SELECT * FROM content WHERE id = ?", (content_id,))
-            row = self.cursor.fetchone()
-            if row:
-                item = dict(row)
-                # Deserialize JSON strings back to lists
-                try:
-                    item['category_tags'] = json.loads(item['category_tags'])
-                except (json.JSONDecodeError, TypeError):
-                    item['category_tags'] = item['category_tags'].split(',') if item['category_tags'] else []
-                
-                try:
-                    item['next_actions'] = json.loads(item['next_actions'])
-                except (json.JSONDecodeError, TypeError):
-                    # Fallback for old data: convert simple string list to list of dicts
-                    if isinstance(item['next_actions'], str):
-                        item['next_actions'] = [{'name': s.strip(), 'priority': 'low'} for s in item['next_actions'].split('\n')]
-                    else:
-                        item['next_actions'] = []
-                
-                try:
-                    item['next_reading'] = json.loads(item['next_reading'])
-                except (json.JSONDecodeError, TypeError):
-                    item['next_reading'] = item['next_reading'].split('\n') if item['next_reading'] else []
-                
-                return item
-            return None
+            cursor = self._connect().execute(self.SQL_GET_CONTENT_BY_ID, (_id_to_db(content_id),))
+            row = cursor.fetchone()
+            return self._deserialize_content_row(row) if row else None
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return None
-        finally:
-            self._disconnect()
 
     def delete_content(self, content_id: str) -> bool:
-        """D eletes a content item from the content database."""
-        self._connect()
+        """Deletes a content item from the content database."""
+        conn = self._connect()
         try:
-            self.cursor.execute("DELETE FROM content WHERE id = ?", (content_id,))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
+            with GLOBAL_WRITE_LOCK:
+                cursor = conn.execute(self.SQL_DELETE_CONTENT, (_id_to_db(content_id),))
+                conn.commit()
+            return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return False
-        finally:
-            self._disconnect()
 
     def add_log_entry(self, idea_id: str, message: str) -> str:
         """Adds a log entry to the processor log database."""
-        self._connect()
-        log_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-        
-        try:
-            self.cursor.execute(
-                "INSERT INTO processor_log (id, idea_id, message, timestamp) VALUES (?, ?, ?, ?)",
-                (log_id, idea_id, message, timestamp),
-            )
-            self.conn.commit()
-            return log_id
+        conn = self._connect()
+        log_id = uuid.uuid4().bytes
+        timestamp = _now_us()
+
+        try:
+            with GLOBAL_WRITE_LOCK:
+                conn.execute(self.SQL_INSERT_LOG, (log_id, _id_to_db(idea_id), message, timestamp))
+                conn.commit()
+            return _id_from_db(log_id)
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred while logging: {e}")
+            logger.error("An error occurred while logging: %s", e)
             return None
-        finally:
-            self._disconnect()
+
+    def get_cached_response(self, cache_key: str, max_age_hours: int) -> Optional[str]:
+        """Retrieves a cached Ollama response JSON string by exact key, if still fresh."""
+        try:
+            cutoff = _now_us() - max_age_hours * 3_600_000_000
+            cursor = self._connect().execute(self.SQL_GET_CACHED_RESPONSE, (cache_key, cutoff))
+            row = cursor.fetchone()
+            return row["response_json"] if row else None
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return None
+
+    def get_cached_embeddings(self, project_type: str, max_age_hours: int) -> List[Dict]:
+        """
+        Retrieves recent same-type cache entries that carry an embedding, for
+        similarity lookup. Responses are prompt-specific, so entries of other
+        project types are never candidates.
+        """
+        try:
+            cutoff = _now_us() - max_age_hours * 3_600_000_000
+            cursor = self._connect().execute(self.SQL_GET_CACHED_EMBEDDINGS, (project_type, cutoff))
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return []
+
+    def add_cached_response(self, cache_key: str, idea_id: str, project_type: str, response_json: str, embedding_json: Optional[str], max_age_hours: int) -> bool:
+        """Stores a generated response in the cache and prunes expired entries."""
+        conn = self._connect()
+        timestamp = _now_us()
+        try:
+            cutoff = _now_us() - max_age_hours * 3_600_000_000
+            with GLOBAL_WRITE_LOCK:
+                conn.execute(self.SQL_PRUNE_CACHE, (cutoff,))
+                conn.execute(self.SQL_UPSERT_CACHED_RESPONSE, (cache_key, _id_to_db(idea_id), project_type, response_json, embedding_json, timestamp))
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return False
+
+    def delete_cached_responses_for_idea(self, idea_id: str) -> bool:
+        """Removes cache entries tied to an idea, e.g. after a rejection."""
+        conn = self._connect()
+        try:
+            with GLOBAL_WRITE_LOCK:
+                conn.execute(self.SQL_DELETE_CACHE_FOR_IDEA, (_id_to_db(idea_id),))
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+            return False
+
+    def add_log_entries(self, entries: List[tuple]) -> bool:
+        """Adds multiple log entries as a single transaction (one commit for the batch)."""
+        if not entries:
+            return True
+        conn = self._connect()
+        timestamp = _now_us()
+        rows = [(uuid.uuid4().bytes, _id_to_db(idea_id), message, timestamp) for idea_id, message in entries]
+        try:
+            with GLOBAL_WRITE_LOCK:
+                conn.executemany(self.SQL_INSERT_LOG, rows)
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.error("An error occurred while logging: %s", e)
+            return False
 
     def get_all_logs(self) -> List[Dict]:
         """Retrieves all log entries from the processor log database."""
-        self._connect()
         try:
-            self.cursor.execute("SELECT * FROM processor_log ORDER BY timestamp DESC")
-            rows = self.cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor = self._connect().execute(self.SQL_GET_ALL_LOGS)
+            rows = cursor.fetchall()
+            return [self._deserialize_log_row(row) for row in rows]
         except sqlite3.Error as e:
-            print(f"[{datetime.now().isoformat()}] An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
             return []
-        finally:
-            self._disconnect()
+
+    def _deserialize_log_row(self, row) -> Dict:
+        """Converts a log row into a dict with the ids in string form."""
+        item = dict(row)
+        item['id'] = _id_from_db(item['id'])
+        item['idea_id'] = _id_from_db(item['idea_id'])
+        item['timestamp'] = _ts_from_db(item['timestamp'])
+        return item
+
+    def iter_all_logs(self, batch_size: int = 500):
+        """Yields log entries, newest first, without materializing the full table."""
+        try:
+            cursor = self._connect().execute(self.SQL_GET_ALL_LOGS)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._deserialize_log_row(row)
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
+
+    def iter_all_logs_raw(self, batch_size: int = 500):
+        """Yields raw sqlite3.Row log rows for encoder-side serialization."""
+        try:
+            cursor = self._connect().execute(self.SQL_GET_ALL_LOGS)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            logger.error("An error occurred: %s", e)
@@ -1,8 +1,18 @@
-from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, BeforeValidator
+from typing import List, Dict, Optional, Any, Annotated
 from datetime import datetime
 import uuid
 
+def _from_epoch_us(value):
+    """Accepts the database's epoch-microsecond integers alongside ISO text."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1_000_000)
+    return value
+
+# Timestamps are stored as INTEGER epoch microseconds but stay `datetime`
+# in the external API types.
+Timestamp = Annotated[datetime, BeforeValidator(_from_epoch_us)]
+
 # Pydantic schema for an Idea entry in the Scratchpad database
 class IdeaBase(BaseModel):
     idea_text: str
@@ -11,12 +21,16 @@ class IdeaBase(BaseModel):
 class IdeaCreate(IdeaBase):
     pass
 
+# Payload for the bulk add endpoint: many ideas in one request
+class IdeaBulkCreate(BaseModel):
+    ideas: List[IdeaCreate]
+
 class Idea(BaseModel):
     id: str
     idea_text: Optional[str] = ""
     context_urls: Optional[str] = ""
     status: str
-    timestamp: datetime
+    timestamp: Timestamp
 
     class Config:
         from_attributes = True
@@ -37,7 +51,7 @@ class ContentCreate(ContentBase):
 class Content(ContentBase):
     id: str
     status: str
-    timestamp: datetime
+    timestamp: Timestamp
     
     class Config:
         from_attributes = True
@@ -46,7 +60,7 @@ class ProcessorLog(BaseModel):
     id: str
     idea_id: str
     message: str
-    timestamp: datetime
+    timestamp: Timestamp
 
 # Schema for the rejection payload from the frontend
 class RejectionPayload(BaseModel):
@@ -1,13 +1,29 @@
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from api.routes import api_router
 from config.settings import settings
-from db.db_manager import DatabaseManager
+from db.db_manager import DatabaseManager, close_all_connections
+from config.prompts import PROMPTS
 from contextlib import asynccontextmanager
-import json
+import logging
+import orjson
 from pathlib import Path
-from datetime import datetime
+
+# Configure logging once for the whole process. Agent modules log through
+# logging.getLogger(__name__), so debug output (and its string formatting)
+# is skipped entirely unless debug mode is on.
+logging.basicConfig(
+    level=logging.DEBUG if settings.is_debug_mode else logging.INFO,
+    format="[%(asctime)s] %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Guards against the module being imported twice under different names
+# (e.g. a stale duplicate on sys.path): a second lifespan run would re-create
+# tables and re-seed prompts.json on the same databases.
+_already_initialized = False
 
 # Define the lifespan event handler for startup and shutdown
 @asynccontextmanager
@@ -15,7 +31,10 @@ async def lifespan(app: FastAPI):
     """
     Handles startup and shutdown events for the application.
     """
-    print(f"[{datetime.now().isoformat()}] Application startup event triggered.")
+    global _already_initialized
+    assert not _already_initialized, "Application startup ran twice; check for duplicate module copies on sys.path."
+    _already_initialized = True
+    logger.info("Application startup event triggered.")
     # Initialize the scratchpad database
     scratchpad_db = DatabaseManager(settings.scratchpad_db_path)
     scratchpad_db.create_tables()
@@ -24,31 +43,23 @@ async def lifespan(app: FastAPI):
     content_db = DatabaseManager(settings.content_db_path, schema_name="content")
     content_db.create_tables()
     
-    # Initialize the prompts file if it doesn't exist
+    # Seed the user-editable prompts file from the built-in templates on
+    # first startup; see config/prompts.py for the template documentation.
     prompts_path = Path("config/prompts.json")
-    prompts_content = {
-        "research": {
-            "full_prompt": "You are a world-class researcher. Your task is to generate a detailed research document based on the following idea and context, formatted as a JSON object. The research document should be approximately 3000 words. The response must be a single JSON object with the following structure:\n{{\n  \"title\": \"A concise title for the research project\",\n  \"content\": \"The full research document, including a detailed introduction, clearly-marked chapters, and a conclusion. Each chapter must end with a relevant case study.\",\n  \"category_tags\": [\"Tag1\", \"Tag2\", \"Tag3\"],\n  \"next_actions\": [{\"name\": \"A descriptive string for a research task\", \"priority\": \"high\"}, {\"name\": \"Another task for future research\", \"priority\": \"medium\"}, {\"name\": \"A final related topic to explore\", \"priority\": \"low\"}],\n  \"next_reading\": [\"A relevant academic paper\", \"A link to a detailed blog post\", \"A book recommendation\"]\n}}\n\nIdea: {idea_text}\n\nContext URLs: {context_urls}\n"
-        },
-        "build": {
-            "full_prompt": "You are a senior project manager. Your task is to create a top-level approach, infrastructure plan, and resource list for a build project, formatted as a JSON object. The plan should be approximately 1000 words. \n\nIdea: {idea_text}\n\nContext URLs: {context_urls}\n\nThe response must be a single JSON object with the following structure:\n{{\n  \"title\": \"A concise title for the build project plan\",\n  \"content\": \"The full 1000-word build plan, outlining the approach, infrastructure, and resources.\",\n  \"category_tags\": [\"Tag1\", \"Tag2\", \"Tag3\"],\n  \"next_actions\": [{{\"name\": \"A descriptive string for the priority resource\", \"priority\": \"high\"}}, {{\"name\": \"A concise description of the prep work\", \"priority\": \"medium\"}}, {{\"name\": \"Another description of the prep work\", \"priority\": \"low\"}}]\n}}\n"
-        },
-        "article": {
-            "full_prompt": "You are a professional content creator and master storyteller. Your task is to write a captivating story-like article based on the following idea and context, formatted as a JSON object. The article should be approximately 2000 words with a clear beginning, middle, and end. The beginning should inspire curiosity and possibilities. The middle should elaborate on the topic. The end should bring the overall theme to a satisfying conclusion, linking it back to the beginning. If the topic could have any real-life case studies, include that as well in the next_reading section of the JSON. \n\nIdea: {idea_text}\n\nContext URLs: {context_urls}\n\nThe response must be a single JSON object, which must mandatorily include next_reading array, with the following structure:\n{{\n  \"title\": \"A catchy title for the article\",\n  \"content\": \"The full 2000-word article with a clear beginning, middle, and end.\",\n  \"category_tags\": [\"Tag1\", \"Tag2\", \"Tag3\"],\n  \"next_reading\": [\"A concise suggestion for additional media or a related resource\", \"A link to supporting information or another article\", \"Ideas on relevant real-life case studies\"]\n}}\n"
-        }
-    }
-    
     if not prompts_path.exists():
         prompts_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(prompts_path, "w") as f:
-            json.dump(prompts_content, f, indent=4)
-        print(f"[{datetime.now().isoformat()}] Created initial prompts file at {prompts_path}")
+        prompts_path.write_bytes(orjson.dumps(PROMPTS, option=orjson.OPT_INDENT_2))
+        logger.info("Created initial prompts file at %s", prompts_path)
 
     yield
-    print(f"[{datetime.now().isoformat()}] Application shutdown event triggered.")
+    # Release the long-lived SQLite connections held by every manager
+    close_all_connections()
+    logger.info("Application shutdown event triggered.")
 
 # Initialize the FastAPI application with the lifespan handler
-app = FastAPI(title="Scintilla Backend API", lifespan=lifespan)
+# ORJSONResponse keeps response serialization on the same C JSON library
+# the rest of the backend uses
+app = FastAPI(title="Scintilla Backend API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configure CORS middleware to allow requests from the front-end
 origins = [
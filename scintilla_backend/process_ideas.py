@@ -1,46 +1,54 @@
 # This is the executable script that will be triggered by a Windows Scheduled Task.
+import asyncio
+import logging
 import time
-from agents.processor_agent import ProcessorAgent
 from config.settings import settings
-from datetime import datetime
 
-def run_processor_batch():
+# Mirror main.py: configure logging before the agents are imported so their
+# module loggers inherit the right level.
+logging.basicConfig(
+    level=logging.DEBUG if settings.is_debug_mode else logging.INFO,
+    format="[%(asctime)s] %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+from agents.processor_agent import ProcessorAgent
+
+async def run_processor_batch():
     """
-    Runs a batch of idea processing.
+    Runs batches of idea processing inside one event loop. Between batches
+    the loop awaits asyncio.sleep instead of blocking the process, so the
+    same invocation handles the reruns that previously needed the Task
+    Scheduler to fire again.
     """
     processor_agent = ProcessorAgent()
-    print(f"[{datetime.now().isoformat()}] Starting processor run...")
+    logger.info("Starting processor run...")
     run_count = settings.processing_batch_max_rerun
     delay_seconds = settings.processing_interval_minutes * 60
     while(run_count > 0):
-        pending_ideas = processor_agent.scratchpad_agent.get_pending_ideas()
-        
-        # Also get ideas that were flagged for reprocessing
-        reprocess_ideas = [idea for idea in processor_agent.scratchpad_agent.get_all_ideas() if idea['status'] == 'reprocess']
-        
-        ideas_to_process = (reprocess_ideas + pending_ideas)[:settings.processing_batch_size]
+        # One indexed query returns the batch with reprocess ideas first,
+        # instead of materializing the whole table and filtering in Python.
+        ideas_to_process = processor_agent.scratchpad_agent.get_processable_batch(settings.processing_batch_size)
 
         if not ideas_to_process:
-            print(f"[{datetime.now().isoformat()}] No new or pending ideas to process. Exiting.")
+            logger.info("No new or pending ideas to process. Exiting.")
             return
 
-        print(f"[{datetime.now().isoformat()}] Found {len(pending_ideas) + len(reprocess_ideas)} ideas in the queue. Processing a batch of {len(ideas_to_process)}.")
-        
-        for idea in ideas_to_process:
-            print(f"[{datetime.now().isoformat()}] Processing idea: {idea['id']}")
-            start_time = time.perf_counter()
-            processor_agent.process_idea(idea)
-            end_time = time.perf_counter()
-            print(f"[{datetime.now().isoformat()}] Finished processing idea {idea['id']} in {end_time - start_time:.2f} seconds.")
+        logger.info("Processing a batch of %d ideas.", len(ideas_to_process))
+
+        start_time = time.perf_counter()
+        await processor_agent.process_batch(ideas_to_process)
+        end_time = time.perf_counter()
+        logger.info("Finished processing batch of %d ideas in %.2f seconds.", len(ideas_to_process), end_time - start_time)
 
         run_count = run_count - 1
-        print(f"[{datetime.now().isoformat()}] Processor run finished. Rerun Count:{run_count}")
+        logger.info("Processor run finished. Rerun Count:%d", run_count)
         if(run_count > 0):
-            reprocess_ideas = [idea for idea in processor_agent.scratchpad_agent.get_all_ideas() if idea['status'] == 'reprocess']
+            reprocess_ideas = processor_agent.scratchpad_agent.get_ideas_by_status('reprocess')
             if(len(reprocess_ideas) == 0):
                 break
-        time.sleep(delay_seconds)
+            await asyncio.sleep(delay_seconds)
 
 
 if __name__ == "__main__":
-    run_processor_batch()
+    asyncio.run(run_processor_batch())
@@ -1,52 +1,145 @@
-import requests
-import json
+import os
+import subprocess
+import sys
 import time
 
-# Base URL for our API
-BASE_URL = "http://localhost:8000"
+import ijson
+import requests
+import orjson
+
+from _http import BASE_URL, SESSION
+from _testlib import (
+    JSON_HEADERS,
+    URL_REVIEWER_ALL,
+    URL_REVIEWER_EVENTS,
+    URL_REVIEWER_LATEST,
+    URL_REVIEWER_REJECT,
+    URL_SCRATCH_SEARCH,
+    add_idea,
+    get_all_ideas,
+    json_body,
+    wait_ready,
+)
+
+# The rejection payload never changes; serialize it to bytes once at
+# import instead of re-encoding the same dict on every run.
+_REJECT_BODY = orjson.dumps({
+    "correction_text": "The infrastructure plan needs to be more specific for a cloud-based solution.",
+    "correction_urls": "https://aws.amazon.com/solutions"
+})
 
-def add_test_idea(idea_text: str, context_urls: str) -> str:
-    """Helper function to add an idea for testing."""
-    data = {"idea_text": idea_text, "context_urls": context_urls}
-    response = requests.post(f"{BASE_URL}/scratchpad/add", json=data)
-    response.raise_for_status()
-    return response.json()['id']
+# Whether the server offers /reviewer/latest; probed once on first use.
+_LATEST_SUPPORTED = None
 
 def get_processed_content_id() -> str:
-    """Helper function to retrieve a processed content item."""
-    response = requests.get(f"{BASE_URL}/reviewer/all")
-    response.raise_for_status()
-    content_list = response.json()
-    if content_list:
-        return content_list[0]['id']
+    """
+    Retrieves the newest processed content ID directly; wait_for_processed
+    falls back to this when no SSE event can be observed.
+    Prefers /reviewer/latest,
+    which moves O(1) bytes however long the review queue grows. On servers
+    without that endpoint it streams /reviewer/all and stops after the
+    first id, so the full list is never parsed (or even downloaded) just
+    to keep one element.
+    """
+    global _LATEST_SUPPORTED
+    if _LATEST_SUPPORTED is not False:
+        response = SESSION.get(URL_REVIEWER_LATEST)
+        _LATEST_SUPPORTED = response.status_code != 404
+        if _LATEST_SUPPORTED:
+            response.raise_for_status()
+            return json_body(response).get('id')
+    with SESSION.get(URL_REVIEWER_ALL, stream=True) as response:
+        response.raise_for_status()
+        for first_id in ijson.items(response.raw, "item.id"):
+            return first_id
     return None
 
-def get_scratchpad_ideas() -> list:
-    """Helper function to get all ideas from the scratchpad."""
-    response = requests.get(f"{BASE_URL}/scratchpad/all")
-    response.raise_for_status()
-    return response.json()
+def wait_for_processed(timeout_seconds: float = 600.0) -> str:
+    """
+    Subscribes to /reviewer/events, then launches process_ideas.py and
+    blocks until the backend announces the newly processed content item,
+    returning its ID. The subscription must be open before the processor
+    starts: the server baselines its freshness token at connect time, so a
+    processor that finishes first (cheap with a warm response cache) would
+    never trigger an event. A monotonic deadline bounds the wait, since
+    the server's one-second keep-alive comments reset the socket read
+    timeout forever. If no event arrives — the deadline expires, or the
+    processor exits and the event still is not seen — the newest content
+    ID is fetched directly via get_processed_content_id instead.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    response = SESSION.get(URL_REVIEWER_EVENTS, stream=True, timeout=(5, 30))
+    processor = None
+    try:
+        response.raise_for_status()
+        processor = run_processor()
+        grace_after_exit = None
+        for line in response.iter_lines():
+            if line.startswith(b"data: "):
+                return orjson.loads(line[len(b"data: "):])['id']
+            now = time.monotonic()
+            if now > deadline:
+                break
+            if processor.poll() is not None:
+                if grace_after_exit is None:
+                    # Leave a few keep-alive cycles for the event to arrive
+                    # once the processor has exited before falling back.
+                    grace_after_exit = now + 3.0
+                elif now > grace_after_exit:
+                    break
+    finally:
+        response.close()
+        if processor is not None:
+            processor.wait(timeout=timeout_seconds)
+    return get_processed_content_id()
+
+# Whether the server offers /scratchpad/search; probed once on first use.
+_SEARCH_SUPPORTED = None
+
+def scratchpad_contains(marker: str) -> bool:
+    """
+    Checks whether any scratchpad idea's text contains `marker`. Prefers
+    the server-side /scratchpad/search filter, which ships only matching
+    rows, and falls back to downloading and scanning the whole list on
+    servers without that endpoint.
+    """
+    global _SEARCH_SUPPORTED
+    if _SEARCH_SUPPORTED is not False:
+        response = SESSION.get(URL_SCRATCH_SEARCH, params={"contains": marker})
+        _SEARCH_SUPPORTED = response.status_code != 404
+        if _SEARCH_SUPPORTED:
+            response.raise_for_status()
+            return bool(json_body(response))
+    return any(marker in idea['idea_text'] for idea in get_all_ideas())
+
+def run_processor() -> subprocess.Popen:
+    """
+    Launches process_ideas.py unattended and returns the handle without
+    blocking. Called by wait_for_processed once its SSE subscription is
+    open, so the event announcing the new content cannot be missed. This
+    replaces the 'run it in a separate terminal' prompts.
+    """
+    return subprocess.Popen(
+        [sys.executable, "process_ideas.py"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
 
 def test_ollama_build_pipeline():
     """Tests the full pipeline for a 'build' project type with Ollama integration."""
-    
+
     print("--- STEP 1: Adding a new 'build' idea to the scratchpad ---")
     initial_idea_text = "Create a robust backend for a real-time multiplayer game."
     initial_context_urls = "https://gamedev.com/backend-intro"
     try:
-        initial_idea_id = add_test_idea(initial_idea_text, initial_context_urls)
+        initial_idea_id = add_idea(initial_idea_text, initial_context_urls)
         print(f"Added idea with ID: {initial_idea_id}")
     except requests.exceptions.RequestException as e:
         print(f"Failed to add initial idea. Is the backend server running? Error: {e}")
         return
 
-    print("\n--- STEP 2: Manually run the processor script `process_ideas.py` ---")
-    print("Please run `python process_ideas.py` in a separate terminal now.")
-    input("Press Enter after the script has finished...")
-    
-    print("\n--- STEP 3: Check for processed content in the reviewer queue ---")
+    print("\n--- STEP 2+3: Running the processor and waiting for reviewer-queue content ---")
     try:
-        processed_content_id = get_processed_content_id()
+        processed_content_id = wait_for_processed()
         if processed_content_id:
             print(f"Found processed content with ID: {processed_content_id}")
             print("\nProcessor pipeline for 'build' type succeeded.")
@@ -58,36 +151,23 @@ def test_ollama_build_pipeline():
         return
 
     print("\n--- STEP 4: Simulating a rejection with correction notes ---")
-    rejection_payload = {
-        "correction_text": "The infrastructure plan needs to be more specific for a cloud-based solution.",
-        "correction_urls": "https://aws.amazon.com/solutions"
-    }
     try:
-        response = requests.post(f"{BASE_URL}/reviewer/reject/{processed_content_id}", json=rejection_payload)
+        response = SESSION.post(URL_REVIEWER_REJECT + processed_content_id, data=_REJECT_BODY, headers=JSON_HEADERS)
         response.raise_for_status()
-        print(response.json()['message'])
+        print(json_body(response)['message'])
     except requests.exceptions.RequestException as e:
         print(f"Failed to reject content. Error: {e}")
         return
 
     print("\n--- STEP 5: Verifying the rejected idea is back in the scratchpad with corrections ---")
-    scratchpad_ideas = get_scratchpad_ideas()
-    found_requeued = False
-    for idea in scratchpad_ideas:
-        if "The infrastructure plan needs to be more specific" in idea['idea_text']:
-            print("Found re-queued idea in scratchpad with corrections.")
-            found_requeued = True
-            break
-    if not found_requeued:
+    if scratchpad_contains("The infrastructure plan needs to be more specific"):
+        print("Found re-queued idea in scratchpad with corrections.")
+    else:
         print("Re-queued idea not found in scratchpad.")
 
-    print("\n--- STEP 6: Manually run the processor again for the re-queued idea ---")
-    print("Please run `python process_ideas.py` in a separate terminal again.")
-    input("Press Enter after the script has finished...")
-
-    print("\n--- STEP 7: Check for the reprocessed content ---")
+    print("\n--- STEP 6+7: Re-running the processor and waiting for the reprocessed content ---")
     try:
-        reprocessed_content_id = get_processed_content_id()
+        reprocessed_content_id = wait_for_processed()
         if reprocessed_content_id and reprocessed_content_id != processed_content_id:
             print(f"Successfully re-processed the idea. New content ID: {reprocessed_content_id}")
             print("Full processor pipeline with rejection and reprocessing succeeded!")
@@ -97,8 +177,9 @@ def test_ollama_build_pipeline():
         print(f"Failed to retrieve reprocessed content. Error: {e}")
 
 if __name__ == "__main__":
-    # Give the server a moment to start
+    # Wait only as long as the server actually needs to come up
     print("Attempting to connect to the backend...")
-    time.sleep(2)
-    
-    test_ollama_build_pipeline()
\ No newline at end of file
+    if not wait_ready(BASE_URL):
+        print("Backend not reachable within 10s; proceeding anyway.")
+
+    test_ollama_build_pipeline()
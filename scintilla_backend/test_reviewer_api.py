@@ -1,85 +1,105 @@
-import requests
-import json
-import time
+import os
+import subprocess
+import sys
 
-# Base URL for our API
-BASE_URL = "http://localhost:8000"
+import orjson
 
-def add_test_idea(idea_text: str, context_urls: str) -> str:
-    """Helper function to add an idea for testing."""
-    data = {"idea_text": idea_text, "context_urls": context_urls}
-    response = requests.post(f"{BASE_URL}/scratchpad/add", json=data)
-    if response.status_code == 200:
-        return response.json()['id']
-    return None
+from _http import BASE_URL, SESSION
+from _testlib import (
+    JSON_HEADERS,
+    URL_REVIEWER_ALL,
+    URL_REVIEWER_APPROVE,
+    URL_REVIEWER_REJECT,
+    URL_SCRATCH_ALL,
+    VERBOSE,
+    add_idea,
+    json_body,
+    print_response,
+    wait_ready,
+)
+
+# The rejection payload never changes; serialize it to bytes once at
+# import instead of re-encoding the same dict on every call.
+_REJECT_BODY = orjson.dumps({
+    "correction_text": "The content needs to be more focused on technical details.",
+    "correction_urls": "https://new-resource.com/tech-details"
+})
 
 def run_processor():
-    """Helper function to trigger the processor script manually."""
-    # Note: This simulates a scheduled task. You need to run this manually in a separate terminal.
-    print("\n--- Manually running the processor script... ---")
-    # This assumes `process_ideas.py` is in the same directory.
-    # In a real test, you might use subprocess.run()
-    # For now, this is a print-only helper to remind the user.
-    print("Please run `python process_ideas.py` in a separate terminal.")
-    input("Press Enter after the script has finished...")
+    """
+    Runs the processor script unattended. This replaces the 'run it in a
+    separate terminal and press Enter' prompt, which dominated the test's
+    wall-clock time with human wait.
+    """
+    print("\n--- Running the processor script... ---")
+    subprocess.run(
+        [sys.executable, "process_ideas.py"],
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        timeout=600,
+    )
 
 
-def test_get_all_content():
+def test_get_all_content(session=None):
     """Test retrieving all content for review."""
+    session = session or SESSION
     print("\n--- Testing GET /reviewer/all ---")
-    response = requests.get(f"{BASE_URL}/reviewer/all")
+    response = session.get(URL_REVIEWER_ALL)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    if response.status_code == 200 and response.json():
-        return response.json()[0]['id']
+    body = json_body(response)
+    print_response(body)
+    if response.status_code == 200 and body:
+        return body[0]['id']
     return None
 
-def test_approve_content(content_id: str):
+def test_approve_content(content_id: str, session=None):
     """Test approving a content item."""
+    session = session or SESSION
     print(f"\n--- Testing POST /reviewer/approve/{content_id} ---")
-    response = requests.post(f"{BASE_URL}/reviewer/approve/{content_id}")
+    response = session.post(URL_REVIEWER_APPROVE + content_id)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    print(f"Response: {json_body(response)}")
 
-def test_reject_content(content_id: str):
+def test_reject_content(content_id: str, session=None):
     """Test rejecting a content item with corrections."""
+    session = session or SESSION
     print(f"\n--- Testing POST /reviewer/reject/{content_id} ---")
-    payload = {
-        "correction_text": "The content needs to be more focused on technical details.",
-        "correction_urls": "https://new-resource.com/tech-details"
-    }
-    response = requests.post(f"{BASE_URL}/reviewer/reject/{content_id}", json=payload)
+    response = session.post(URL_REVIEWER_REJECT + content_id, data=_REJECT_BODY, headers=JSON_HEADERS)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    print(f"Response: {json_body(response)}")
 
 if __name__ == "__main__":
-    # Give the server a moment to start
+    # Wait only as long as the server actually needs to come up
     print("Attempting to connect to the backend...")
-    time.sleep(2)
-    
+    if not wait_ready(BASE_URL):
+        print("Backend not reachable within 10s; proceeding anyway.")
+
     # 1. Add a test idea and process it
-    idea_id = add_test_idea("Develop a new backend service for a mobile app. This is a build project.", "https://example.com/api")
+    idea_id = add_idea("Develop a new backend service for a mobile app. This is a build project.", "https://example.com/api")
     if not idea_id:
         print("Failed to add idea. Exiting.")
-    
+
     run_processor()
-    
+
     # 2. Get the processed content ID
     content_id = test_get_all_content()
     if not content_id:
         print("No processed content found. Exiting.")
-    
+
     # 3. Test rejecting the content and checking the queue
     test_reject_content(content_id)
     print("\n--- Verifying the rejected idea is back in the scratchpad... ---")
-    get_all_ideas_response = requests.get(f"{BASE_URL}/scratchpad/all")
-    print(f"Scratchpad content: {json.dumps(get_all_ideas_response.json(), indent=2)}")
-    
+    get_all_ideas_response = SESSION.get(URL_SCRATCH_ALL)
+    if VERBOSE:
+        print(f"Scratchpad content: {orjson.dumps(json_body(get_all_ideas_response), option=orjson.OPT_INDENT_2).decode()}")
+    else:
+        print(f"Scratchpad ideas: {len(json_body(get_all_ideas_response))}")
+
     # 4. Cleanup and test the approve flow
-    add_test_idea("Write an article about the future of AI in research.", "https://research-paper.com")
+    add_idea("Write an article about the future of AI in research.", "https://research-paper.com")
     run_processor()
     content_id_to_approve = test_get_all_content()
     if content_id_to_approve:
         test_approve_content(content_id_to_approve)
         print("\n--- Verifying the content was purged after approval... ---")
-        test_get_all_content()
\ No newline at end of file
+        test_get_all_content()
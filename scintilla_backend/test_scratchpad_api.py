@@ -1,10 +1,20 @@
 # This file remains unchanged from the previous version, but is included for completeness.
-import requests
-import json
-import time
+import asyncio
+import orjson
 
-# Base URL for our API
-BASE_URL = "http://localhost:8000"
+from _http import BASE_URL, SESSION
+from _testlib import (
+    JSON_HEADERS,
+    URL_PROC_STATUS,
+    URL_SCRATCH_ADD,
+    URL_SCRATCH_ADD_BULK,
+    URL_SCRATCH_ALL,
+    URL_SCRATCH_DEL,
+    bounded_gather,
+    json_body,
+    print_response,
+    wait_ready,
+)
 
 def test_add_idea():
     """Test adding a new idea to the scratchpad."""
@@ -13,59 +23,104 @@ def test_add_idea():
         "idea_text": "Develop a new front-end for a website. This is a build project.",
         "context_urls": "https://example.com/api, https://docs.service.com"
     }
-    response = requests.post(f"{BASE_URL}/scratchpad/add", json=data)
+    response = SESSION.post(URL_SCRATCH_ADD, data=orjson.dumps(data), headers=JSON_HEADERS)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    
+    body = json_body(response)
+    print_response(body)
+
     if response.status_code == 200:
-        return response.json()['id']
+        return body['id']
     return None
 
+# Whether the server offers /scratchpad/add_bulk; probed once on first use.
+_BULK_SUPPORTED = None
+
+def add_test_ideas(items: list) -> list:
+    """
+    Adds many ideas in one POST /scratchpad/add_bulk round-trip instead of
+    one request per idea. Falls back to per-item adds on servers without
+    the bulk endpoint, remembering the answer so the probe happens once.
+    """
+    global _BULK_SUPPORTED
+    print(f"\n--- Testing POST /scratchpad/add_bulk with {len(items)} ideas ---")
+    if _BULK_SUPPORTED is not False:
+        response = SESSION.post(URL_SCRATCH_ADD_BULK, data=orjson.dumps({"ideas": items}), headers=JSON_HEADERS)
+        _BULK_SUPPORTED = response.status_code != 404
+        if _BULK_SUPPORTED:
+            print(f"Status Code: {response.status_code}")
+            body = json_body(response)
+            print_response(body)
+            return body.get('ids', []) if response.status_code == 200 else []
+        print("Bulk endpoint not available; falling back to per-item adds.")
+    ids = []
+    for item in items:
+        response = SESSION.post(URL_SCRATCH_ADD, data=orjson.dumps(item), headers=JSON_HEADERS)
+        ids.append(json_body(response).get('id') if response.status_code == 200 else None)
+    return ids
+
 def test_get_all_ideas():
     """Test retrieving all ideas from the scratchpad."""
     print("\n--- Testing GET /scratchpad/all ---")
-    response = requests.get(f"{BASE_URL}/scratchpad/all")
+    response = SESSION.get(URL_SCRATCH_ALL)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    
+    body = json_body(response)
+    print_response(body)
+
     if response.status_code == 200:
-        return [idea['id'] for idea in response.json()]
+        return [idea['id'] for idea in body]
     return []
-    
+
 def test_delete_idea(idea_id):
     """Test deleting a specific idea by ID."""
     print(f"\n--- Testing DELETE /scratchpad/delete/{idea_id} ---")
-    response = requests.delete(f"{BASE_URL}/scratchpad/delete/{idea_id}")
+    response = SESSION.delete(URL_SCRATCH_DEL + idea_id)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
+    print(f"Response: {json_body(response)}")
 
 def test_get_processor_status():
     """Test retrieving the processor status."""
     print("\n--- Testing GET /processor/status ---")
-    response = requests.get(f"{BASE_URL}/processor/status")
+    response = SESSION.get(URL_PROC_STATUS)
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(json_body(response))
 
 if __name__ == "__main__":
-    # Give the server a moment to start
+    # Wait only as long as the server actually needs to come up
     print("Attempting to connect to the backend...")
-    time.sleep(2)
-    
-    # Test adding two ideas
-    new_idea_id1 = test_add_idea()
-    test_add_idea()
+    if not wait_ready(BASE_URL):
+        print("Backend not reachable within 10s; proceeding anyway.")
+
+    async def main():
+        # Both test ideas travel in one bulk request (one round-trip and one
+        # server-side transaction for the pair); the independent status and
+        # list reads that follow are still fanned out concurrently, capped
+        # by bounded_gather (TEST_CONCURRENCY) so wider fan-outs added here
+        # later cannot flood the backend. The blocking helpers run
+        # unchanged in worker threads, sharing the pooled session
+        # (urllib3's pool is thread-safe).
+        ids = await asyncio.to_thread(add_test_ideas, [
+            {
+                "idea_text": "Develop a new front-end for a website. This is a build project.",
+                "context_urls": "https://example.com/api, https://docs.service.com"
+            },
+            {
+                "idea_text": "Research efficient caching strategies for small APIs.",
+                "context_urls": "https://example.com/caching"
+            },
+        ])
+        new_idea_id1 = ids[0] if ids else None
 
-    # Test the processor status endpoint
-    test_get_processor_status()
+        await bounded_gather(
+            asyncio.to_thread(test_get_processor_status),
+            asyncio.to_thread(test_get_all_ideas),
+        )
 
-    # Test retrieving all ideas
-    test_get_all_ideas()
+        # Deleting depends on the first idea's ID, so this part stays ordered
+        if new_idea_id1:
+            test_delete_idea(new_idea_id1)
+            test_get_all_ideas()
 
-    # Test deleting one of the ideas
-    if new_idea_id1:
-        test_delete_idea(new_idea_id1)
-        test_get_all_ideas()
+    asyncio.run(main())
 
     # You can now manually run the `process_ideas.py` script to see it process the remaining idea.
     print("\nTo continue testing, run `python process_ideas.py` in your terminal.")
-